@@ -7,6 +7,7 @@ import os
 import sys
 import json
 import asyncio
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Optional, Dict, Any
 from fastapi import FastAPI, File, UploadFile, HTTPException, Form
@@ -20,11 +21,26 @@ sys.path.insert(0, str(Path(__file__).parent))
 from process_papers import process_papers_from_folder
 from extraction.pdf_reader import extract_text_from_pdf, extract_title_from_pdf
 from extraction.spoon_tool import extract_paper_structure_async
-from phase2.synergy_agent import SynergyAgent
-from phase3.hypothesis_agent import HypothesisAgent
+from phase2.synergy_agent import get_synergy_agent
+from phase3.hypothesis_agent import get_hypothesis_agent
 from phase4.minting_service import mint_hypothesis
+from phase4.registry_store import start_log_buffer, stop_log_buffer
+from phase4.spoon_tools import start_log_listener, stop_log_listener
 
-app = FastAPI(title="Trace API", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Install the registry log buffer and tool log listener for the lifetime of the server."""
+    start_log_buffer()
+    start_log_listener()
+    try:
+        yield
+    finally:
+        stop_log_listener()
+        stop_log_buffer()
+
+
+app = FastAPI(title="Trace API", version="1.0.0", lifespan=lifespan)
 
 # CORS configuration for frontend
 app.add_middleware(
@@ -267,11 +283,11 @@ async def process_papers_from_text(
             raise ValueError(f"Paper B extraction error: {paper_b_json['error']}")
         
         # Phase 2: Analyze synergies
-        agent = SynergyAgent()
+        agent = get_synergy_agent()
         synergy_json = await agent.analyze_async(paper_a_json, paper_b_json)
         
         # Phase 3: Generate hypothesis
-        hypothesis_agent = HypothesisAgent()
+        hypothesis_agent = get_hypothesis_agent()
         hypothesis_card = await hypothesis_agent.generate_hypothesis_async(
             paper_a_json, paper_b_json, synergy_json
         )
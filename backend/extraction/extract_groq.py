@@ -338,6 +338,12 @@ async def fix_json_async(bad_text):
     """
     Fallback to repair malformed JSON using SpoonOS LLM (or Groq if not available).
     """
+    # Fast path: text may already be valid JSON (e.g. spurious retry)
+    try:
+        return json.loads(bad_text)
+    except json.JSONDecodeError:
+        pass
+
     fix_prompt = f"""
 The following text should be valid JSON but is not. Fix it.
 
@@ -7,6 +7,8 @@ Extracts text from PDF files for paper structure extraction.
 """
 import os
 import glob
+import time
+import functools
 from typing import Tuple, Optional
 
 try:
@@ -14,6 +16,20 @@ try:
 except ImportError:
     raise ImportError("PyPDF2>=3.0 is required. Install with: pip install PyPDF2>=3.0")
 
+# PDF listings and extracted text are memoized per (path, mtime) so repeated
+# runs over the same inputs skip the directory scan and the PDF parse.
+# Entries are only used once the mtime is at least one timestamp tick older
+# than now (git's racy-index rule), so a change landing in the same tick is
+# never hidden. The window covers the coarsest common granularity (FAT/exFAT
+# 2 s; HFS+ and many SMB/NFS mounts 1 s).
+PDF_CACHE_SIZE = 8
+_CACHE_RACY_NS = 2_000_000_000
+
+
+def _is_settled(mtime_ns: int) -> bool:
+    """Whether a path's mtime is old enough to key a cache entry on."""
+    return time.time_ns() - mtime_ns > _CACHE_RACY_NS
+
 
 def extract_text_smart(pdf_path: str, max_chars: int = 12000) -> Tuple[str, Optional[str]]:
     """
@@ -81,6 +97,29 @@ def extract_text_smart(pdf_path: str, max_chars: int = 12000) -> Tuple[str, Opti
         raise ValueError(f"Error reading PDF {pdf_path}: {str(e)}")
 
 
+@functools.lru_cache(maxsize=PDF_CACHE_SIZE)
+def _extract_text_cached(pdf_path: str, mtime_ns: int, size: int, max_chars: int) -> Tuple[str, Optional[str]]:
+    """extract_text_smart() keyed on the file's mtime and size."""
+    return extract_text_smart(pdf_path, max_chars)
+
+
+def read_pdf(pdf_path: str, max_chars: int = 12000) -> Tuple[str, Optional[str]]:
+    """
+    Read one PDF with extract_text_smart(), memoized while the file is unchanged.
+    
+    Returns:
+        (text, title)
+    """
+    try:
+        stat = os.stat(pdf_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+    
+    if _is_settled(stat.st_mtime_ns):
+        return _extract_text_cached(os.path.abspath(pdf_path), stat.st_mtime_ns, stat.st_size, max_chars)
+    return extract_text_smart(pdf_path, max_chars)
+
+
 def extract_text_from_pdf(pdf_path: str) -> str:
     """
     Extract text from a PDF file (backward compatibility wrapper).
@@ -106,15 +145,32 @@ def extract_title_from_pdf(pdf_path: str) -> Optional[str]:
         return None
 
 
-def read_pdfs_from_folder(folder_path: str = "input_pdfs") -> Tuple[str, str, Optional[str], Optional[str]]:
+def find_pdfs(folder_path: str = "input_pdfs") -> Tuple[str, str]:
     """
-    Read exactly 2 PDF files from the specified folder.
+    Locate exactly 2 PDF files in the specified folder.
     
-    Uses the new First-5-Last-1 strategy for maximum information density.
+    The listing is memoized while the folder is unchanged.
+    
+    Returns:
+        (paper_a_path, paper_b_path), in sorted filename order
     """
     if not os.path.exists(folder_path):
         raise ValueError(f"Input folder does not exist: {folder_path}")
     
+    mtime_ns = os.stat(folder_path).st_mtime_ns
+    if _is_settled(mtime_ns):
+        return _find_pdfs_cached(folder_path, os.path.abspath(folder_path), mtime_ns)
+    return _find_pdfs(folder_path)
+
+
+@functools.lru_cache(maxsize=PDF_CACHE_SIZE)
+def _find_pdfs_cached(folder_path: str, abs_folder_path: str, mtime_ns: int) -> Tuple[str, str]:
+    """_find_pdfs() keyed on the folder's absolute path and mtime."""
+    return _find_pdfs(folder_path)
+
+
+def _find_pdfs(folder_path: str) -> Tuple[str, str]:
+    """Glob the folder for exactly 2 PDFs (see find_pdfs)."""
     # Use glob to find PDFs
     pdf_files = glob.glob(os.path.join(folder_path, "*.pdf"))
     pdf_files.sort()
@@ -122,8 +178,19 @@ def read_pdfs_from_folder(folder_path: str = "input_pdfs") -> Tuple[str, str, Op
     if len(pdf_files) != 2:
         raise ValueError(f"Expected exactly 2 PDF files in {folder_path}. Found {len(pdf_files)}.")
     
-    paper_a_text, paper_a_title = extract_text_smart(pdf_files[0])
-    paper_b_text, paper_b_title = extract_text_smart(pdf_files[1])
+    return pdf_files[0], pdf_files[1]
+
+
+def read_pdfs_from_folder(folder_path: str = "input_pdfs") -> Tuple[str, str, Optional[str], Optional[str]]:
+    """
+    Read exactly 2 PDF files from the specified folder.
+    
+    Uses the new First-5-Last-1 strategy for maximum information density.
+    """
+    paper_a_path, paper_b_path = find_pdfs(folder_path)
+    
+    paper_a_text, paper_a_title = read_pdf(paper_a_path)
+    paper_b_text, paper_b_title = read_pdf(paper_b_path)
     
     return paper_a_text, paper_b_text, paper_a_title, paper_b_title
 
@@ -5,6 +5,7 @@ This is the ONLY tool in Phase 1. It converts paper text into structured JSON.
 """
 import json
 import sys
+import asyncio
 from pathlib import Path
 
 # Add extraction directory to path for imports
@@ -14,6 +15,13 @@ if str(extraction_dir) not in sys.path:
 
 from extract_paper import extract_paper
 
+# Prefer orjson (C extension) for the tool's JSON output; stdlib json fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     from spoon_ai import Tool
     SPOON_AVAILABLE = True
@@ -23,6 +31,16 @@ except ImportError:
     print("Install with: pip install spoon-ai-sdk")
 
 
+def _dumps(obj) -> str:
+    """Serialize tool output as indented JSON."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass  # e.g. non-str keys or >64-bit ints from the LLM; stdlib handles them
+    return json.dumps(obj, indent=2)
+
+
 async def extract_paper_structure_async(paper_text: str, title: str = "") -> str:
     """
     Async SpoonOS Tool: Extract structured scientific information from paper text.
@@ -45,17 +63,20 @@ async def extract_paper_structure_async(paper_text: str, title: str = "") -> str
     """
     # Input validation
     if not paper_text or not isinstance(paper_text, str):
-        return json.dumps({"error": "paper_text must be a non-empty string"}, indent=2)
+        return _dumps({"error": "paper_text must be a non-empty string"})
     
     if len(paper_text.strip()) == 0:
-        return json.dumps({"error": "paper_text cannot be empty"}, indent=2)
+        return _dumps({"error": "paper_text cannot be empty"})
     
     if title and not isinstance(title, str):
-        return json.dumps({"error": "title must be a string"}, indent=2)
+        return _dumps({"error": "title must be a string"})
     
     try:
-        # Call extraction function (synchronous, but wrapped in async)
-        result = extract_paper(paper_text.strip(), title.strip() if title else "")
+        # Call extraction function (synchronous LLM call) off the event loop,
+        # so concurrent extractions actually overlap
+        result = await asyncio.to_thread(
+            extract_paper, paper_text.strip(), title.strip() if title else ""
+        )
         
         # Validate output structure
         required_fields = ["claims", "methods", "evidence", "explicit_limitations", "implicit_limitations", "variables"]
@@ -67,9 +88,9 @@ async def extract_paper_structure_async(paper_text: str, title: str = "") -> str
         if isinstance(result.get("evidence"), list):
             result["evidence"] = result["evidence"][:2]
         
-        return json.dumps(result, indent=2)
+        return _dumps(result)
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dumps({"error": str(e)})
 
 
 def create_extraction_tool():
@@ -8,7 +8,7 @@ This phase compares two Phase 1 structured JSON outputs and identifies:
 - In-memory graph representation
 """
 
-from phase2.synergy_agent import SynergyAgent, analyze_papers
+from phase2.synergy_agent import SynergyAgent, get_synergy_agent, analyze_papers
 
-__all__ = ["SynergyAgent", "analyze_papers"]
+__all__ = ["SynergyAgent", "get_synergy_agent", "analyze_papers"]
 
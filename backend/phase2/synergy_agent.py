@@ -9,6 +9,7 @@ Uses SpoonOS Agent protocol: Agent → SpoonOS → LLM
 import json
 import os
 import asyncio
+import functools
 from typing import Dict, List, Any, Optional
 from dotenv import load_dotenv
 
@@ -542,6 +543,12 @@ Return ONLY valid JSON."""
         Fix malformed JSON using SpoonOS Agent.
         REQUIRES: SpoonOS must be available.
         """
+        # Fast path: text may already be valid JSON (e.g. spurious retry)
+        try:
+            return json.loads(bad_text)
+        except json.JSONDecodeError:
+            pass
+
         if not self.spoon_available or not self.spoon_agent:
             raise RuntimeError(
                 "SpoonOS is required for JSON fixing.\n"
@@ -576,6 +583,12 @@ Return only corrected JSON with the structure:
         Fix malformed JSON using SpoonOS Agent (sync version).
         REQUIRES: SpoonOS must be available.
         """
+        # Fast path: text may already be valid JSON (e.g. spurious retry)
+        try:
+            return json.loads(bad_text)
+        except json.JSONDecodeError:
+            pass
+
         if not self.spoon_available or not self.spoon_agent:
             raise RuntimeError(
                 "SpoonOS is required for JSON fixing.\n"
@@ -617,11 +630,22 @@ Return only corrected JSON with the structure:
             ) from e
 
 
+@functools.lru_cache(maxsize=1)
+def get_synergy_agent() -> SynergyAgent:
+    """
+    Get the shared SynergyAgent.
+    
+    The agent holds no per-analysis state, so one instance (and its Groq
+    client) is reused across runs. A failed construction is not cached.
+    """
+    return SynergyAgent()
+
+
 def analyze_papers(paper_a_json: Dict[str, Any], paper_b_json: Dict[str, Any]) -> Dict[str, Any]:
     """
     Convenience function to analyze two papers.
     """
-    agent = SynergyAgent()
+    agent = get_synergy_agent()
     return agent.analyze(paper_a_json, paper_b_json)
 
 
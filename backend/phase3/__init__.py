@@ -6,7 +6,7 @@ This phase generates a testable scientific hypothesis from Phase 1 and Phase 2 o
 Turns cross-paper synergies into falsifiable scientific ideas.
 """
 
-from phase3.hypothesis_agent import HypothesisAgent, generate_hypothesis
+from phase3.hypothesis_agent import HypothesisAgent, get_hypothesis_agent, generate_hypothesis
 
-__all__ = ["HypothesisAgent", "generate_hypothesis"]
+__all__ = ["HypothesisAgent", "get_hypothesis_agent", "generate_hypothesis"]
 
@@ -13,6 +13,7 @@ import json
 import os
 import uuid
 import asyncio
+import functools
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
 
@@ -37,6 +38,12 @@ except ImportError:
         client = Groq(api_key=api_key)
     MODEL = "llama-3.3-70b-versatile"
 
+# Fields every generated HypothesisCard must carry (hypothesis_id is assigned by the agent)
+_GENERATED_CARD_FIELDS = frozenset((
+    "primary_synergy_id", "hypothesis", "rationale", "source_support",
+    "proposed_experiment", "confidence", "risk_notes"
+))
+
 # Initialize SpoonOS components if available
 spoon_agent = None
 spoon_chatbot = None
@@ -741,13 +748,7 @@ Return ONLY valid JSON."""
     
     def _validate_hypothesis_card(self, card: Dict[str, Any]):
         """Validate that the hypothesis card has all required fields."""
-        required_fields = [
-            "primary_synergy_id", "hypothesis", "rationale", "source_support",
-            "proposed_experiment", "confidence", "risk_notes"
-        ]
-        
-        missing_fields = [f for f in required_fields if f not in card]
-        if missing_fields:
+        if not card.keys() >= _GENERATED_CARD_FIELDS:
             # Add defaults for missing fields rather than failing
             if "primary_synergy_id" not in card:
                 card["primary_synergy_id"] = "unknown"
@@ -962,6 +963,12 @@ Return ONLY the JSON object, no commentary."""
         """
         Fix malformed JSON using SpoonOS Agent (fallback to Groq if agent fails).
         """
+        # Fast path: text may already be valid JSON (e.g. spurious retry)
+        try:
+            return json.loads(bad_text)
+        except json.JSONDecodeError:
+            pass
+
         # Try direct Groq first (more reliable for JSON)
         try:
             return await self._fix_json_with_groq_async(bad_text)
@@ -1005,6 +1012,12 @@ Return only corrected JSON with the Hypothesis Card structure:
         Fix malformed JSON using SpoonOS Agent (sync version).
         REQUIRES: SpoonOS must be available.
         """
+        # Fast path: text may already be valid JSON (e.g. spurious retry)
+        try:
+            return json.loads(bad_text)
+        except json.JSONDecodeError:
+            pass
+
         if not self.spoon_available or not self.spoon_agent:
             raise RuntimeError(
                 "SpoonOS is required for JSON fixing.\n"
@@ -1050,6 +1063,17 @@ Return only corrected JSON with the Hypothesis Card structure:
             ) from e
 
 
+@functools.lru_cache(maxsize=1)
+def get_hypothesis_agent() -> HypothesisAgent:
+    """
+    Get the shared HypothesisAgent.
+    
+    The agent holds no per-card state, so one instance (and its Groq client)
+    is reused across runs. A failed construction is not cached.
+    """
+    return HypothesisAgent()
+
+
 def generate_hypothesis(paper_a_json: Dict[str, Any], paper_b_json: Dict[str, Any],
                         synergy_json: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -1063,7 +1087,7 @@ def generate_hypothesis(paper_a_json: Dict[str, Any], paper_b_json: Dict[str, An
     Returns:
         dict: Hypothesis Card with hypothesis, rationale, experiment, etc.
     """
-    agent = HypothesisAgent()
+    agent = get_hypothesis_agent()
     return agent.generate_hypothesis(paper_a_json, paper_b_json, synergy_json)
 
 
@@ -4,18 +4,26 @@ Phase 4: Hypothesis Minting & Registry
 This phase handles minting hypotheses to off-chain registry and Neo blockchain.
 """
 
-from phase4.minting_service import mint_hypothesis, validate_hypothesis_card, canonicalise_card, compute_hash
-from phase4.registry_store import save_hypothesis, get_hypothesis, list_hypotheses
-from phase4.neo_client import write_hypothesis_receipt
+from phase4.minting_service import mint_hypothesis, validate_hypothesis_card, canonicalise_card, compute_hash, hash_card, hash_cards
+from phase4.registry_store import save_hypothesis, save_hypotheses_batch, get_hypothesis, list_hypotheses, flush_logs, start_log_buffer, stop_log_buffer
+from phase4.neo_client import write_hypothesis_receipt, write_hypothesis_receipt_async, write_hypothesis_receipts_batch
 
 __all__ = [
     "mint_hypothesis",
     "validate_hypothesis_card",
     "canonicalise_card",
     "compute_hash",
+    "hash_card",
+    "hash_cards",
     "save_hypothesis",
+    "save_hypotheses_batch",
     "get_hypothesis",
     "list_hypotheses",
-    "write_hypothesis_receipt"
+    "flush_logs",
+    "start_log_buffer",
+    "stop_log_buffer",
+    "write_hypothesis_receipt",
+    "write_hypothesis_receipt_async",
+    "write_hypothesis_receipts_batch"
 ]
 
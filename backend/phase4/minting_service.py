@@ -11,13 +11,23 @@ This module demonstrates the complete minting flow using official SpoonOS tools
 to satisfy the hackathon requirement:
 "Use at least one Tool module from the official Spoon-toolkit"
 """
+import os
+import re
 import json
 import hashlib
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from phase4.registry_store import save_hypothesis
-from phase4.neo_client import write_hypothesis_receipt
+from phase4.neo_client import write_hypothesis_receipt, write_hypothesis_receipt_async
+
+# Prefer orjson (C extension) for canonical JSON; stdlib json fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Import SpoonOS tool integrations
 try:
@@ -25,16 +35,37 @@ try:
         SpoonToolManager,
         get_tool_manager,
         store_hypothesis_on_neofs,
-        mint_with_payment,
-        NEOFS_AVAILABLE,
-        X402_AVAILABLE
+        mint_with_payment
     )
     SPOON_TOOLS_AVAILABLE = True
 except ImportError as e:
     print(f"[Warning] SpoonOS tools not available: {e}")
     SPOON_TOOLS_AVAILABLE = False
-    NEOFS_AVAILABLE = False
-    X402_AVAILABLE = False
+
+
+# HypothesisCard schema, built once at import time
+REQUIRED_CARD_FIELDS = (
+    "hypothesis_id",
+    "primary_synergy_id",
+    "hypothesis",
+    "rationale",
+    "source_support",
+    "proposed_experiment",
+    "confidence",
+    "risk_notes"
+)
+REQUIRED_SOURCE_FIELDS = ("paper_A_claim_ids", "paper_B_claim_ids", "variables_used")
+REQUIRED_EXPERIMENT_FIELDS = ("description", "measurements", "expected_direction")
+
+# hash_cards() hashes canonical payloads at least this large on a thread
+# pool (hashlib releases the GIL for large inputs); smaller ones are hashed
+# inline, where pool dispatch would cost more than the hash itself
+HASH_PARALLEL_MIN_BYTES = 1 << 20
+
+# Set forms for the valid-card fast path (one subset check per level)
+_REQUIRED_CARD_KEYS = frozenset(REQUIRED_CARD_FIELDS)
+_REQUIRED_SOURCE_KEYS = frozenset(REQUIRED_SOURCE_FIELDS)
+_REQUIRED_EXPERIMENT_KEYS = frozenset(REQUIRED_EXPERIMENT_FIELDS)
 
 
 def validate_hypothesis_card(card: Dict[str, Any]) -> None:
@@ -47,18 +78,17 @@ def validate_hypothesis_card(card: Dict[str, Any]) -> None:
     Raises:
         ValueError: If required fields are missing
     """
-    required_fields = [
-        "hypothesis_id",
-        "primary_synergy_id",
-        "hypothesis",
-        "rationale",
-        "source_support",
-        "proposed_experiment",
-        "confidence",
-        "risk_notes"
-    ]
+    # Fast path: a complete card passes with three subset checks; the
+    # per-field walk below only runs to build the error message
+    if card.keys() >= _REQUIRED_CARD_KEYS:
+        source_support = card["source_support"]
+        proposed_experiment = card["proposed_experiment"]
+        if (isinstance(source_support, dict) and isinstance(proposed_experiment, dict)
+                and source_support.keys() >= _REQUIRED_SOURCE_KEYS
+                and proposed_experiment.keys() >= _REQUIRED_EXPERIMENT_KEYS):
+            return
     
-    missing_fields = [f for f in required_fields if f not in card]
+    missing_fields = [f for f in REQUIRED_CARD_FIELDS if f not in card]
     if missing_fields:
         raise ValueError(f"HypothesisCard missing required fields: {missing_fields}")
     
@@ -67,8 +97,7 @@ def validate_hypothesis_card(card: Dict[str, Any]) -> None:
     if not isinstance(source_support, dict):
         raise ValueError("source_support must be a dict")
     
-    required_source_fields = ["paper_A_claim_ids", "paper_B_claim_ids", "variables_used"]
-    missing_source_fields = [f for f in required_source_fields if f not in source_support]
+    missing_source_fields = [f for f in REQUIRED_SOURCE_FIELDS if f not in source_support]
     if missing_source_fields:
         raise ValueError(f"source_support missing required fields: {missing_source_fields}")
     
@@ -76,12 +105,61 @@ def validate_hypothesis_card(card: Dict[str, Any]) -> None:
     if not isinstance(proposed_experiment, dict):
         raise ValueError("proposed_experiment must be a dict")
     
-    required_experiment_fields = ["description", "measurements", "expected_direction"]
-    missing_experiment_fields = [f for f in required_experiment_fields if f not in proposed_experiment]
+    missing_experiment_fields = [f for f in REQUIRED_EXPERIMENT_FIELDS if f not in proposed_experiment]
     if missing_experiment_fields:
         raise ValueError(f"proposed_experiment missing required fields: {missing_experiment_fields}")
 
 
+# orjson output can differ from json.dumps in three places: exponent floats
+# (1e-7 vs 1e-07), small floats (0.00005 vs 5e-05) and null (json writes
+# NaN/Infinity, orjson writes null). Exponent candidates are found by the
+# literal "e" (fast scan) and confirmed below.
+_EXPONENT_CANDIDATE_RE = re.compile(rb"e[-0-9]")
+
+
+def _orjson_matches_stdlib(data: bytes) -> bool:
+    """Whether orjson output is byte-identical to the stdlib encoding."""
+    if b"null" in data or b"0.0000" in data:
+        return False
+    for match in _EXPONENT_CANDIDATE_RE.finditer(data):
+        if data[match.start() - 1:match.start()].isdigit():
+            return False
+    return True
+
+
+def _canonical_bytes(card: Dict[str, Any]) -> bytes:
+    """
+    Canonical UTF-8 JSON bytes of a HypothesisCard (see canonicalise_card).
+    
+    orjson is used when its output is byte-identical to the stdlib encoding,
+    so for JSON-native values content hashes never depend on whether orjson
+    is installed. datetimes and dataclasses are passed through to the stdlib
+    encoder, which rejects them either way; UUID and plain Enum values are
+    still encoded by orjson but raise TypeError without it.
+    """
+    # Only include core HypothesisCard fields (exclude minting metadata)
+    canonical = {field: card[field] for field in REQUIRED_CARD_FIELDS if field in card}
+    
+    if ORJSON_AVAILABLE:
+        try:
+            data = orjson.dumps(
+                canonical,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+            )
+        except orjson.JSONEncodeError:
+            # e.g. non-str keys or >64-bit ints (stdlib handles them), or a
+            # passed-through datetime/dataclass (stdlib raises TypeError)
+            data = None
+        if data is not None and _orjson_matches_stdlib(data):
+            return data
+    
+    # Compact JSON (no extra whitespace); sort_keys sorts nested dicts at
+    # every level inside the C encoder, without sorted copies
+    return json.dumps(
+        canonical, sort_keys=True, separators=(',', ':'), ensure_ascii=False
+    ).encode('utf-8')
+
+
 def canonicalise_card(card: Dict[str, Any]) -> str:
     """
     Canonicalise HypothesisCard JSON to deterministic string.
@@ -90,38 +168,7 @@ def canonicalise_card(card: Dict[str, Any]) -> str:
     - Removes any extra metadata fields (content_hash, created_at, version, neo_tx_id)
     - Returns canonical JSON string
     """
-    # Create a copy to avoid modifying original
-    canonical = {}
-    
-    # Only include core HypothesisCard fields (exclude minting metadata)
-    core_fields = [
-        "hypothesis_id",
-        "primary_synergy_id",
-        "hypothesis",
-        "rationale",
-        "source_support",
-        "proposed_experiment",
-        "confidence",
-        "risk_notes"
-    ]
-    
-    for field in core_fields:
-        if field in card:
-            canonical[field] = card[field]
-    
-    # Recursively sort nested dicts
-    def sort_dict_recursive(d):
-        if isinstance(d, dict):
-            return {k: sort_dict_recursive(v) for k, v in sorted(d.items())}
-        elif isinstance(d, list):
-            return [sort_dict_recursive(item) for item in d]
-        else:
-            return d
-    
-    canonical_sorted = sort_dict_recursive(canonical)
-    
-    # Return as compact JSON (no extra whitespace)
-    return json.dumps(canonical_sorted, separators=(',', ':'), ensure_ascii=False)
+    return _canonical_bytes(card).decode('utf-8')
 
 
 def compute_hash(canonical_json: str) -> str:
@@ -134,12 +181,151 @@ def compute_hash(canonical_json: str) -> str:
     Returns:
         str: Hex hash prefixed with "0x"
     """
-    hash_bytes = hashlib.sha256(canonical_json.encode('utf-8')).digest()
-    return "0x" + hash_bytes.hex()
+    # SHA-256 is the attested format: the registry contract, frontend and
+    # docs all expect it, so it must not vary by host or library availability
+    return "0x" + hashlib.sha256(canonical_json.encode('utf-8')).hexdigest()
+
+
+def hash_card(card: Dict[str, Any]) -> str:
+    """
+    Compute the content hash of a HypothesisCard.
+
+    Equivalent to compute_hash(canonicalise_card(card)); the canonical JSON
+    bytes are hashed in a single update without a str round trip (streaming
+    through JSONEncoder.iterencode falls back to the pure-Python encoder and
+    is slower).
+
+    Args:
+        card: HypothesisCard JSON dict
+
+    Returns:
+        str: Hex hash prefixed with "0x"
+    """
+    return _sha256_hex(_canonical_bytes(card))
+
+
+def _sha256_hex(data: bytes) -> str:
+    """SHA-256 of canonical bytes, in the "0x"-prefixed content hash format."""
+    return "0x" + hashlib.sha256(data).hexdigest()
+
+
+def hash_cards(cards: List[Dict[str, Any]]) -> List[str]:
+    """
+    Compute the content hashes of several HypothesisCards.
+    
+    Same result as [hash_card(card) for card in cards]. Canonicalisation runs
+    inline (it holds the GIL); payloads of HASH_PARALLEL_MIN_BYTES or more
+    are hashed concurrently when more than one CPU is available.
+    
+    Args:
+        cards: List of HypothesisCard JSON dicts
+    
+    Returns:
+        list: Hex hashes prefixed with "0x", in input order
+    """
+    payloads = [_canonical_bytes(card) for card in cards]
+    large = [i for i, payload in enumerate(payloads) if len(payload) >= HASH_PARALLEL_MIN_BYTES]
+    workers = min(len(large), os.cpu_count() or 1)
+    
+    if workers < 2:
+        return [_sha256_hex(payload) for payload in payloads]
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {i: executor.submit(_sha256_hex, payloads[i]) for i in large}
+        return [
+            futures[i].result() if i in futures else _sha256_hex(payload)
+            for i, payload in enumerate(payloads)
+        ]
+
+
+def _prepare_mint(card: Dict[str, Any]) -> str:
+    """
+    Validate a HypothesisCard and compute its content hash.
+
+    Pure CPU work shared by the sync and async mint paths.
+
+    Returns:
+        str: Content hash prefixed with "0x"
+    """
+    # Validate
+    validate_hypothesis_card(card)
+
+    # Canonicalise and compute hash
+    return hash_card(card)
+
+
+def _enrich_card(card: Dict[str, Any], content_hash: str, author_wallet: str,
+                 neo_tx_id: str) -> Dict[str, Any]:
+    """Build the registry copy of a card with its minting metadata."""
+    # Single construction, no intermediate copy
+    return {
+        **card,
+        "content_hash": content_hash,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "version": "v1",
+        "author_wallet": author_wallet,
+        "neo_tx_id": neo_tx_id
+    }
+
+
+def _apply_tool_results(enriched_card: Dict[str, Any],
+                        neofs_result: Optional[Dict[str, Any]],
+                        x402_result: Optional[Dict[str, Any]]) -> None:
+    """Record NeoFS and X402 results on the enriched card."""
+    # Add NeoFS info to enriched card
+    if neofs_result:
+        enriched_card["neofs_object_id"] = neofs_result.get("object_id")
+        enriched_card["neofs_container_id"] = neofs_result.get("container_id")
+
+    # Add X402 payment info to enriched card
+    if x402_result:
+        enriched_card["x402_tx_hash"] = x402_result.get("tx_hash")
+        enriched_card["x402_amount_usdc"] = x402_result.get("amount_usdc")
+
+
+def _store_enriched_card(enriched_card: Dict[str, Any],
+                         registry_batch: Optional[List[Dict[str, Any]]]) -> None:
+    """Store in off-chain registry with all metadata (or defer to the batch)."""
+    if registry_batch is None:
+        save_hypothesis(enriched_card)
+    else:
+        registry_batch.append(enriched_card)
+
+
+def _build_mint_result(enriched_card: Dict[str, Any],
+                       neofs_result: Optional[Dict[str, Any]],
+                       x402_result: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the MintResult returned by both mint paths."""
+    result = {
+        "hypothesis_id": enriched_card["hypothesis_id"],
+        "content_hash": enriched_card["content_hash"],
+        "neo_tx_id": enriched_card["neo_tx_id"],
+        "created_at": enriched_card["created_at"],
+        "version": "v1"
+    }
+
+    # Add SpoonOS tool results
+    if neofs_result:
+        result["neofs"] = {
+            "object_id": neofs_result.get("object_id"),
+            "container_id": neofs_result.get("container_id"),
+            "success": neofs_result.get("success", False)
+        }
+
+    if x402_result:
+        result["x402"] = {
+            "tx_hash": x402_result.get("tx_hash"),
+            "amount_usdc": x402_result.get("amount_usdc"),
+            "network": x402_result.get("network"),
+            "success": x402_result.get("success", False)
+        }
+
+    return result
 
 
 def mint_hypothesis(card: Dict[str, Any], author_wallet: str,
-                    use_neofs: bool = True, use_x402: bool = False) -> Dict[str, Any]:
+                    use_neofs: bool = True, use_x402: bool = False,
+                    registry_batch: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
     """
     Mint a hypothesis to off-chain registry, Neo blockchain, and NeoFS.
 
@@ -147,11 +333,11 @@ def mint_hypothesis(card: Dict[str, Any], author_wallet: str,
     1. Validate HypothesisCard
     2. Canonicalise JSON
     3. Compute content hash
-    4. Enrich card with metadata
-    5. Store in off-chain registry
-    6. Write Neo transaction
-    7. Store on NeoFS (SpoonOS Tool) - NEW
-    8. Process X402 payment if enabled (SpoonOS Tool) - NEW
+    4. Write Neo transaction
+    5. Enrich card with metadata
+    6. Store on NeoFS (SpoonOS Tool) - NEW
+    7. Process X402 payment if enabled (SpoonOS Tool) - NEW
+    8. Store in off-chain registry
     9. Return MintResult
 
     Args:
@@ -159,28 +345,14 @@ def mint_hypothesis(card: Dict[str, Any], author_wallet: str,
         author_wallet: Author's wallet address
         use_neofs: Whether to store on NeoFS (default: True)
         use_x402: Whether to process X402 payment (default: False)
+        registry_batch: Optional collector; when given, the enriched card is
+            appended to it instead of being saved, so the caller can write
+            many cards with one save_hypotheses_batch() call
 
     Returns:
         dict: MintResult with all transaction IDs
     """
-    # Validate
-    validate_hypothesis_card(card)
-
-    # Canonicalise
-    canonical_json = canonicalise_card(card)
-
-    # Compute hash
-    content_hash = compute_hash(canonical_json)
-
-    # Enrich card with metadata
-    enriched_card = card.copy()
-    enriched_card["content_hash"] = content_hash
-    enriched_card["created_at"] = datetime.now(timezone.utc).isoformat()
-    enriched_card["version"] = "v1"
-    enriched_card["author_wallet"] = author_wallet
-
-    # Store in off-chain registry
-    save_hypothesis(enriched_card)
+    content_hash = _prepare_mint(card)
 
     # Write to Neo blockchain
     neo_tx_id = write_hypothesis_receipt(
@@ -189,8 +361,7 @@ def mint_hypothesis(card: Dict[str, Any], author_wallet: str,
         author_wallet=author_wallet
     )
 
-    # Add Neo transaction ID to enriched card
-    enriched_card["neo_tx_id"] = neo_tx_id
+    enriched_card = _enrich_card(card, content_hash, author_wallet, neo_tx_id)
 
     # =========================================================================
     # SpoonOS Tool Integrations (Hackathon Requirements)
@@ -205,49 +376,44 @@ def mint_hypothesis(card: Dict[str, Any], author_wallet: str,
             neofs_result, x402_result = _run_spoon_tools_async(
                 enriched_card, author_wallet, use_neofs, use_x402
             )
-
-            # Add NeoFS info to enriched card
-            if neofs_result:
-                enriched_card["neofs_object_id"] = neofs_result.get("object_id")
-                enriched_card["neofs_container_id"] = neofs_result.get("container_id")
-
-            # Add X402 payment info to enriched card
-            if x402_result:
-                enriched_card["x402_tx_hash"] = x402_result.get("tx_hash")
-                enriched_card["x402_amount_usdc"] = x402_result.get("amount_usdc")
+            _apply_tool_results(enriched_card, neofs_result, x402_result)
         except Exception as e:
             print(f"[Warning] SpoonOS tool integration failed: {e}")
             # Continue without NeoFS/X402 - not critical
 
-    # Update registry with all metadata
-    save_hypothesis(enriched_card)
+    _store_enriched_card(enriched_card, registry_batch)
 
-    # Return MintResult
-    result = {
-        "hypothesis_id": card["hypothesis_id"],
-        "content_hash": content_hash,
-        "neo_tx_id": neo_tx_id,
-        "created_at": enriched_card["created_at"],
-        "version": "v1"
-    }
+    return _build_mint_result(enriched_card, neofs_result, x402_result)
 
-    # Add SpoonOS tool results
-    if neofs_result:
-        result["neofs"] = {
-            "object_id": neofs_result.get("object_id"),
-            "container_id": neofs_result.get("container_id"),
-            "success": neofs_result.get("success", False)
-        }
 
-    if x402_result:
-        result["x402"] = {
-            "tx_hash": x402_result.get("tx_hash"),
-            "amount_usdc": x402_result.get("amount_usdc"),
-            "network": x402_result.get("network"),
-            "success": x402_result.get("success", False)
-        }
+async def _spoon_tool_operations(
+    enriched_card: Dict[str, Any],
+    author_wallet: str,
+    use_neofs: bool,
+    use_x402: bool
+) -> tuple:
+    """Store on NeoFS and/or process the X402 payment for an enriched card."""
+    manager = get_tool_manager()
+    await manager.initialize()
 
-    return result
+    neofs_result = None
+    x402_result = None
+
+    if use_neofs:
+        print("[SpoonOS] Storing hypothesis on NeoFS...")
+        neofs_result = await manager.store_hypothesis(enriched_card)
+        print(f"[SpoonOS] NeoFS storage result: {neofs_result.get('success', False)}")
+
+    if use_x402:
+        print("[SpoonOS] Processing X402 payment...")
+        x402_result = await manager.process_payment(
+            hypothesis_id=enriched_card.get("hypothesis_id"),
+            content_hash=enriched_card.get("content_hash"),
+            author_wallet=author_wallet
+        )
+        print(f"[SpoonOS] X402 payment result: {x402_result.get('success', False)}")
+
+    return neofs_result, x402_result
 
 
 def _run_spoon_tools_async(
@@ -261,28 +427,8 @@ def _run_spoon_tools_async(
 
     This helper handles the async-to-sync bridge for SpoonOS tools.
     """
-    async def _async_operations():
-        manager = get_tool_manager()
-        await manager.initialize()
-
-        neofs_result = None
-        x402_result = None
-
-        if use_neofs:
-            print("[SpoonOS] Storing hypothesis on NeoFS...")
-            neofs_result = await manager.store_hypothesis(enriched_card)
-            print(f"[SpoonOS] NeoFS storage result: {neofs_result.get('success', False)}")
-
-        if use_x402:
-            print("[SpoonOS] Processing X402 payment...")
-            x402_result = await manager.process_payment(
-                hypothesis_id=enriched_card.get("hypothesis_id"),
-                content_hash=enriched_card.get("content_hash"),
-                author_wallet=author_wallet
-            )
-            print(f"[SpoonOS] X402 payment result: {x402_result.get('success', False)}")
-
-        return neofs_result, x402_result
+    def operations():
+        return _spoon_tool_operations(enriched_card, author_wallet, use_neofs, use_x402)
 
     # Check if we're already in an async context
     try:
@@ -290,107 +436,68 @@ def _run_spoon_tools_async(
         # We're in an async context - use create_task
         import concurrent.futures
         with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(asyncio.run, _async_operations())
+            future = executor.submit(asyncio.run, operations())
             return future.result(timeout=30)
     except RuntimeError:
         # No event loop running - we can use asyncio.run
-        return asyncio.run(_async_operations())
+        return asyncio.run(operations())
 
 
 async def mint_hypothesis_async(
     card: Dict[str, Any],
     author_wallet: str,
     use_neofs: bool = True,
-    use_x402: bool = False
+    use_x402: bool = False,
+    registry_batch: Optional[List[Dict[str, Any]]] = None
 ) -> Dict[str, Any]:
     """
     Async version of mint_hypothesis.
 
-    Use this when calling from an async context for better performance.
+    Use this when calling from an async context for better performance: the
+    Neo receipt and SpoonOS tools are awaited on the caller's event loop.
+    Hashing and enrichment run inline; the registry write (fsync, rename and
+    index commit) runs in a worker thread so it never blocks the loop.
+    registry_batch defers the registry write as in mint_hypothesis().
     """
-    # Validate
-    validate_hypothesis_card(card)
-
-    # Canonicalise
-    canonical_json = canonicalise_card(card)
-
-    # Compute hash
-    content_hash = compute_hash(canonical_json)
-
-    # Enrich card with metadata
-    enriched_card = card.copy()
-    enriched_card["content_hash"] = content_hash
-    enriched_card["created_at"] = datetime.now(timezone.utc).isoformat()
-    enriched_card["version"] = "v1"
-    enriched_card["author_wallet"] = author_wallet
-
-    # Store in off-chain registry
-    save_hypothesis(enriched_card)
+    content_hash = _prepare_mint(card)
 
     # Write to Neo blockchain
-    neo_tx_id = write_hypothesis_receipt(
+    neo_tx_id = await write_hypothesis_receipt_async(
         hypothesis_id=card["hypothesis_id"],
         content_hash=content_hash,
         author_wallet=author_wallet
     )
 
-    enriched_card["neo_tx_id"] = neo_tx_id
+    enriched_card = _enrich_card(card, content_hash, author_wallet, neo_tx_id)
 
     # SpoonOS Tool Integrations
     neofs_result = None
     x402_result = None
 
-    if SPOON_TOOLS_AVAILABLE:
-        manager = get_tool_manager()
-        await manager.initialize()
-
-        if use_neofs:
-            print("[SpoonOS] Storing hypothesis on NeoFS...")
-            neofs_result = await manager.store_hypothesis(enriched_card)
-            if neofs_result:
-                enriched_card["neofs_object_id"] = neofs_result.get("object_id")
-                enriched_card["neofs_container_id"] = neofs_result.get("container_id")
-
-        if use_x402:
-            print("[SpoonOS] Processing X402 payment...")
-            x402_result = await manager.process_payment(
-                hypothesis_id=enriched_card.get("hypothesis_id"),
-                content_hash=enriched_card.get("content_hash"),
-                author_wallet=author_wallet
+    if SPOON_TOOLS_AVAILABLE and (use_neofs or use_x402):
+        try:
+            neofs_result, x402_result = await _spoon_tool_operations(
+                enriched_card, author_wallet, use_neofs, use_x402
             )
-            if x402_result:
-                enriched_card["x402_tx_hash"] = x402_result.get("tx_hash")
-
-    # Update registry
-    save_hypothesis(enriched_card)
-
-    # Build result
-    result = {
-        "hypothesis_id": card["hypothesis_id"],
-        "content_hash": content_hash,
-        "neo_tx_id": neo_tx_id,
-        "created_at": enriched_card["created_at"],
-        "version": "v1"
-    }
+            _apply_tool_results(enriched_card, neofs_result, x402_result)
+        except Exception as e:
+            print(f"[Warning] SpoonOS tool integration failed: {e}")
+            # Continue without NeoFS/X402 - not critical
 
-    if neofs_result:
-        result["neofs"] = {
-            "object_id": neofs_result.get("object_id"),
-            "container_id": neofs_result.get("container_id"),
-            "success": neofs_result.get("success", False)
-        }
+    if registry_batch is None:
+        await asyncio.to_thread(save_hypothesis, enriched_card)
+    else:
+        registry_batch.append(enriched_card)
 
-    if x402_result:
-        result["x402"] = {
-            "tx_hash": x402_result.get("tx_hash"),
-            "amount_usdc": x402_result.get("amount_usdc"),
-            "success": x402_result.get("success", False)
-        }
-
-    return result
+    return _build_mint_result(enriched_card, neofs_result, x402_result)
 
 
 if __name__ == "__main__":
+    from phase4.registry_store import start_log_buffer
+    from phase4.spoon_tools import start_log_listener
+    start_log_buffer()
+    start_log_listener()
+
     # Example usage demonstrating SpoonOS tool integrations
     print("=" * 60)
     print("Hypothesis Minting Service - SpoonOS Tool Demo")
@@ -415,9 +522,17 @@ if __name__ == "__main__":
         "risk_notes": []
     }
 
+    if SPOON_TOOLS_AVAILABLE:
+        # Probes the (lazily imported) SpoonOS tool modules
+        from phase4 import spoon_tools
+        neofs_available = spoon_tools.NEOFS_AVAILABLE
+        x402_available = spoon_tools.X402_AVAILABLE
+    else:
+        neofs_available = x402_available = False
+
     print("\nSpoonOS Tool Availability:")
-    print(f"  NeoFS Tools: {NEOFS_AVAILABLE}")
-    print(f"  X402 Tools: {X402_AVAILABLE}")
+    print(f"  NeoFS Tools: {neofs_available}")
+    print(f"  X402 Tools: {x402_available}")
     print(f"  SpoonOS Integration: {SPOON_TOOLS_AVAILABLE}")
 
     try:
@@ -8,10 +8,14 @@ Documentation: https://dojo.coz.io/neo3/mamba/
 """
 import json
 import hashlib
+import functools
 import os
 import asyncio
+import atexit
+import threading
+import contextlib
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple, Callable, Awaitable
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -26,6 +30,8 @@ try:
     from neo3.network.payloads.verification import Signer
     from neo3.wallet.account import Account
     from neo3.core.types import UInt160
+    from neo3.api import noderpc
+    import aiohttp
     NEO_AVAILABLE = True
 except ImportError as e:
     NEO_AVAILABLE = False
@@ -53,10 +59,138 @@ NEO_N3_TESTNET_NETWORK_ID = 894710606
 # Deploy using Neo3-Boa (Python): https://github.com/CityOfZion/neo3-boa
 REGISTRY_CONTRACT_HASH = os.getenv("NEO_REGISTRY_CONTRACT", "")
 
+# Attestation payload layout; static fields are filled once, per-call fields
+# are patched onto a copy
+_ATTESTATION_PAYLOAD_TEMPLATE = {
+    "type": "trace_hypothesis_attestation",
+    "version": "v1",
+    "hypothesis_id": "",
+    "content_hash": "",
+    "author": "",
+    "timestamp": ""
+}
+
 # Block explorers for verification:
 # - Dora (recommended): https://dora.coz.io/
 # - NeoTube: https://neotube.io/
 # - OneGate: https://explorer.onegate.space/
+_EXPLORER_TX_URLS = {
+    "mainnet": "https://dora.coz.io/transaction/neo3/mainnet/{}",
+    "testnet": "https://dora.coz.io/transaction/neo3/testnet/{}",
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _registry_contract() -> "GenericContract":
+    """
+    Build the registry contract wrapper once per process.
+
+    REGISTRY_CONTRACT_HASH is fixed at import time, so the parsed UInt160 and
+    GenericContract can be shared by every on-chain call.
+    """
+    return GenericContract(UInt160.from_string(REGISTRY_CONTRACT_HASH.removeprefix("0x")))
+
+
+def _verified_value(result: Any) -> bool:
+    """
+    Read a registry verify() invocation result.
+
+    Args:
+        result: Invocation result object (its .result holds the returned value)
+
+    Returns:
+        bool: The returned boolean, or False for a missing or non-boolean value
+    """
+    value = getattr(result, "result", None)
+    return value if isinstance(value, bool) else False
+
+
+def _hash_value(result: Any) -> Optional[str]:
+    """
+    Read a registry get_hash() invocation result.
+
+    Args:
+        result: Invocation result object (its .result holds the returned value)
+
+    Returns:
+        str: The stored content hash, or None if empty or of an unexpected type
+    """
+    value = getattr(result, "result", None)
+    if isinstance(value, (bytes, bytearray)):
+        value = bytes(value).decode("utf-8", errors="replace")
+    return value if isinstance(value, str) and value else None
+
+
+# Keep-alive pool limits for Neo RPC HTTP connections
+RPC_POOL_LIMIT = 64
+RPC_POOL_LIMIT_PER_HOST = 32
+RPC_KEEPALIVE_TIMEOUT = 30.0
+
+# Pooled aiohttp connector for the shared sync-wrapper loop (see
+# _run_with_shared_client). Connectors are loop-bound, so only that one
+# long-lived loop pools connections; it is closed with the loop at exit.
+_rpc_connector: Optional["aiohttp.TCPConnector"] = None
+
+
+def _shared_loop_connector() -> Optional["aiohttp.TCPConnector"]:
+    """Return the pooled connector if running on the shared loop, else None."""
+    if _rpc_connector is None or _rpc_connector.closed or _neo_loop is None:
+        return None
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    return _rpc_connector if loop is _neo_loop else None
+
+
+if NEO_AVAILABLE:
+    class _PooledNeoRpcClient(noderpc.NeoRpcClient):
+        """
+        NeoRpcClient whose HTTP session borrows the shared keep-alive connector.
+
+        ChainFacade opens a short-lived NeoRpcClient per call; without a shared
+        connector each one pays its own TCP (and TLS) handshake. Clients built
+        on any other event loop behave exactly like the stock class.
+        """
+
+        def __init__(self, host: str, **kwargs):
+            connector = _shared_loop_connector()
+            if connector is not None:
+                kwargs.setdefault("connector", connector)
+                kwargs.setdefault("connector_owner", False)
+            super().__init__(host, **kwargs)
+
+
+# Number of shared-loop operations currently inside _pooled_rpc_clients(); only
+# touched from the shared loop's thread, so no lock is needed
+_pooled_rpc_users = 0
+_stock_rpc_client: Optional[type] = None
+
+
+@contextlib.contextmanager
+def _pooled_rpc_clients():
+    """
+    Have ChainFacade build pooled RPC clients for the duration of the block.
+
+    ChainFacade constructs noderpc.NeoRpcClient inline and offers no way to
+    pass a session, so the pooled class is swapped in while shared loop
+    operations execute. Operations overlap on that loop, so the swap is
+    reference counted and the original is restored when the last one ends.
+    """
+    global _pooled_rpc_users, _stock_rpc_client
+    if not NEO_AVAILABLE:
+        yield
+        return
+    if _pooled_rpc_users == 0:
+        _stock_rpc_client = noderpc.NeoRpcClient
+        noderpc.NeoRpcClient = _PooledNeoRpcClient
+    _pooled_rpc_users += 1
+    try:
+        yield
+    finally:
+        _pooled_rpc_users -= 1
+        if _pooled_rpc_users == 0:
+            noderpc.NeoRpcClient = _stock_rpc_client
 
 
 class NeoClient:
@@ -95,10 +229,8 @@ class NeoClient:
 
             # Create facade for appropriate network
             if self.rpc_url:
-                # Custom RPC URL
-                from neo3.api.noderpc import NeoRpcClient
-                rpc_client = NeoRpcClient(self.rpc_url)
-                self.facade = ChainFacade(rpc_client)
+                # Custom RPC URL (the facade opens pooled RPC clients per call)
+                self.facade = ChainFacade(rpc_host=self.rpc_url)
             elif self.network == "mainnet":
                 self.facade = ChainFacade.node_provider_mainnet()
             else:
@@ -149,6 +281,76 @@ class NeoClient:
         # Use registry contract if available
         return await self._write_registry_attestation(hypothesis_id, content_hash, author_wallet)
 
+    async def write_attestations_batch(
+        self,
+        items: List[Tuple[str, str, str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Write attestations for several hypotheses in a single transaction.
+
+        With a registry contract, one script calls register() once per item
+        (Neo VM allows multiple contract calls per transaction). Without one,
+        a single self-transfer attests the whole batch, since the simple
+        attestation carries no per-hypothesis data on-chain.
+
+        Args:
+            items: List of (hypothesis_id, content_hash, author_wallet) tuples
+
+        Returns:
+            list: One transaction result dict per item, in input order
+        """
+        if not self.facade or not self.account:
+            raise RuntimeError("Neo client not properly initialized. Check private key.")
+
+        if not items:
+            return []
+
+        if not REGISTRY_CONTRACT_HASH:
+            hypothesis_id, content_hash, author_wallet = items[0]
+            result = await self._write_simple_attestation(hypothesis_id, content_hash, author_wallet)
+            return [
+                {**result, "hypothesis_id": hyp_id, "content_hash": c_hash, "batch_size": len(items)}
+                for hyp_id, c_hash, _ in items
+            ]
+
+        try:
+            registry = _registry_contract()
+
+            receipt = await self.facade.invoke_multi([
+                registry.call_function(
+                    "register",
+                    [hypothesis_id.encode('utf-8'), content_hash, self.account.script_hash]
+                )
+                for hypothesis_id, content_hash, _ in items
+            ])
+
+            # One register() result per item is required; anything else means
+            # the outcome can't be attributed, so report the batch as failed
+            results = receipt.result if hasattr(receipt, 'result') else None
+            if not isinstance(results, (list, tuple)) or len(results) != len(items):
+                raise RuntimeError(
+                    f"unexpected receipt result shape for {len(items)} registrations: {type(results).__name__}"
+                )
+
+            return [
+                {
+                    "success": bool(success),
+                    "tx_id": str(receipt.tx_hash),
+                    "included_in_block": receipt.included_in_block,
+                    "confirmations": receipt.confirmations,
+                    "gas_consumed": str(receipt.gas_consumed),
+                    "hypothesis_id": hypothesis_id,
+                    "content_hash": content_hash,
+                    "attestation_type": "registry_contract",
+                    "contract_hash": REGISTRY_CONTRACT_HASH,
+                    "batch_size": len(items)
+                }
+                for (hypothesis_id, content_hash, _), success in zip(items, results)
+            ]
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to write registry attestation batch: {e}")
+
     async def _write_simple_attestation(
         self,
         hypothesis_id: str,
@@ -161,15 +363,12 @@ class NeoClient:
         This is a fallback when no registry contract is deployed.
         The attestation data is embedded in the transaction attributes.
         """
-        # Build attestation payload
-        payload = {
-            "type": "trace_hypothesis_attestation",
-            "version": "v1",
-            "hypothesis_id": hypothesis_id,
-            "content_hash": content_hash,
-            "author": author_wallet,
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
+        # Build attestation payload from the static template
+        payload = _ATTESTATION_PAYLOAD_TEMPLATE.copy()
+        payload["hypothesis_id"] = hypothesis_id
+        payload["content_hash"] = content_hash
+        payload["author"] = author_wallet
+        payload["timestamp"] = datetime.now(timezone.utc).isoformat()
 
         # Convert to bytes for embedding (for future use in transaction attributes)
         payload_bytes = json.dumps(payload, separators=(',', ':')).encode('utf-8')
@@ -223,13 +422,7 @@ class NeoClient:
         - verify(hypothesis_id: bytes, expected_hash: str) -> bool
         """
         try:
-            # Parse registry contract hash (remove 0x prefix if present)
-            contract_hash = REGISTRY_CONTRACT_HASH
-            if contract_hash.startswith("0x"):
-                contract_hash = contract_hash[2:]
-
-            # Create generic contract wrapper for registry
-            registry = GenericContract(UInt160.from_string(contract_hash))
+            registry = _registry_contract()
 
             # Convert hypothesis_id to bytes for the contract
             hypothesis_id_bytes = hypothesis_id.encode('utf-8')
@@ -280,11 +473,7 @@ class NeoClient:
             return False
 
         try:
-            contract_hash = REGISTRY_CONTRACT_HASH
-            if contract_hash.startswith("0x"):
-                contract_hash = contract_hash[2:]
-
-            registry = GenericContract(UInt160.from_string(contract_hash))
+            registry = _registry_contract()
             hypothesis_id_bytes = hypothesis_id.encode('utf-8')
 
             # Call verify function (read-only, no gas cost)
@@ -295,7 +484,7 @@ class NeoClient:
                 )
             )
 
-            return bool(result.result) if hasattr(result, 'result') else False
+            return _verified_value(result)
 
         except Exception as e:
             print(f"[Neo] Verification failed: {e}")
@@ -318,11 +507,7 @@ class NeoClient:
             return None
 
         try:
-            contract_hash = REGISTRY_CONTRACT_HASH
-            if contract_hash.startswith("0x"):
-                contract_hash = contract_hash[2:]
-
-            registry = GenericContract(UInt160.from_string(contract_hash))
+            registry = _registry_contract()
             hypothesis_id_bytes = hypothesis_id.encode('utf-8')
 
             result = await self.facade.test_invoke(
@@ -332,14 +517,71 @@ class NeoClient:
                 )
             )
 
-            if hasattr(result, 'result') and result.result:
-                return str(result.result)
-            return None
+            return _hash_value(result)
 
         except Exception as e:
             print(f"[Neo] Failed to get on-chain hash: {e}")
             return None
 
+    async def verify_and_fetch_batch(
+        self,
+        pairs: List[Tuple[str, str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Verify several attestations and fetch their stored hashes in one round-trip.
+
+        All get_hash/verify calls are packed into a single test-invoke script
+        (read-only, no gas cost). If the batched invocation fails, falls back
+        to concurrent per-hypothesis calls.
+
+        Args:
+            pairs: List of (hypothesis_id, expected_hash) tuples
+
+        Returns:
+            list: One dict per pair with hypothesis_id, verified and on_chain_hash
+        """
+        if not pairs:
+            return []
+
+        if not REGISTRY_CONTRACT_HASH or not self.facade:
+            return [
+                {"hypothesis_id": hypothesis_id, "verified": False, "on_chain_hash": None}
+                for hypothesis_id, _ in pairs
+            ]
+
+        try:
+            registry = _registry_contract()
+            calls = []
+            for hypothesis_id, expected_hash in pairs:
+                hypothesis_id_bytes = hypothesis_id.encode('utf-8')
+                calls.append(registry.call_function("get_hash", [hypothesis_id_bytes]))
+                calls.append(registry.call_function("verify", [hypothesis_id_bytes, expected_hash]))
+
+            results = await self.facade.test_invoke_multi(calls)
+            if len(results) != len(calls):
+                raise RuntimeError(f"expected {len(calls)} results, got {len(results)}")
+
+            return [
+                {
+                    "hypothesis_id": hypothesis_id,
+                    "verified": _verified_value(results[2 * i + 1]),
+                    "on_chain_hash": _hash_value(results[2 * i])
+                }
+                for i, (hypothesis_id, _) in enumerate(pairs)
+            ]
+
+        except Exception as e:
+            print(f"[Neo] Batched verification failed, falling back to per-item calls: {e}")
+
+        hashes, verified = await asyncio.gather(
+            asyncio.gather(*(self.get_on_chain_hash(hypothesis_id) for hypothesis_id, _ in pairs)),
+            asyncio.gather(*(self.verify_on_chain(hypothesis_id, expected) for hypothesis_id, expected in pairs))
+        )
+        return [
+            {"hypothesis_id": hypothesis_id, "verified": ok, "on_chain_hash": on_chain_hash}
+            for (hypothesis_id, _), on_chain_hash, ok in zip(pairs, hashes, verified)
+        ]
+
     async def get_attestation(self, tx_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve attestation details from a transaction.
@@ -383,6 +625,118 @@ class NeoClient:
 
 # Synchronous wrapper functions for backward compatibility
 
+# Shared client and event loop for the sync wrappers. The loop runs forever on
+# a dedicated daemon thread and sync callers submit coroutines to it, so calls
+# from different threads overlap on one loop, one client and one pooled RPC
+# connector. _neo_lock only guards starting/stopping that loop; the client is
+# created under its own short lock so async callers never wait on an RPC.
+_neo_client: Optional[NeoClient] = None
+_neo_client_lock = threading.Lock()
+_neo_loop: Optional[asyncio.AbstractEventLoop] = None
+_neo_loop_thread: Optional[threading.Thread] = None
+_neo_lock = threading.Lock()
+
+
+def _shared_client() -> NeoClient:
+    """Return the shared NeoClient, (re)creating it if uninitialized."""
+    global _neo_client
+    client = _neo_client
+    if client is not None and client.facade is not None:
+        return client
+    with _neo_client_lock:
+        if _neo_client is None or _neo_client.facade is None:
+            _neo_client = NeoClient()
+        return _neo_client
+
+
+def _shared_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared event loop, starting its thread on first use."""
+    global _neo_loop, _neo_loop_thread
+    loop = _neo_loop
+    if loop is not None:
+        return loop
+    with _neo_lock:
+        if _neo_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="neo-rpc-loop", daemon=True)
+            thread.start()
+            _neo_loop, _neo_loop_thread = loop, thread
+            atexit.register(_close_shared_loop)
+        return _neo_loop
+
+
+async def _run_pooled(operation: Callable[[NeoClient], Awaitable[Any]]) -> Any:
+    """Await operation(client) on the shared loop with pooled RPC connections."""
+    global _rpc_connector
+    if NEO_AVAILABLE and (_rpc_connector is None or _rpc_connector.closed):
+        _rpc_connector = aiohttp.TCPConnector(
+            limit=RPC_POOL_LIMIT,
+            limit_per_host=RPC_POOL_LIMIT_PER_HOST,
+            keepalive_timeout=RPC_KEEPALIVE_TIMEOUT
+        )
+    with _pooled_rpc_clients():
+        return await operation(_shared_client())
+
+
+def _run_with_shared_client(operation: Callable[[NeoClient], Awaitable[Any]]) -> Any:
+    """Run operation(client) on the shared NeoClient and event loop, blocking until done."""
+    future = asyncio.run_coroutine_threadsafe(_run_pooled(operation), _shared_loop())
+    return future.result()
+
+
+async def _close_rpc_connector() -> None:
+    """Close the shared loop's pooled connector, if any."""
+    global _rpc_connector
+    connector, _rpc_connector = _rpc_connector, None
+    if connector is not None:
+        await connector.close()
+
+
+def _close_shared_loop() -> None:
+    """Close the shared loop's pooled RPC connections, then stop the loop and its thread."""
+    global _neo_loop, _neo_loop_thread
+    with _neo_lock:
+        loop, thread = _neo_loop, _neo_loop_thread
+        if loop is None:
+            return
+        _neo_loop = _neo_loop_thread = None
+    try:
+        asyncio.run_coroutine_threadsafe(_close_rpc_connector(), loop).result()
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def _receipts_configured() -> bool:
+    """Check the Neo SDK and key are available, explaining the mock fallback if not."""
+    if not NEO_AVAILABLE:
+        print("[Warning] Neo SDK not available - returning mock transaction ID")
+        return False
+
+    if not NEO_PRIVATE_KEY:
+        print("[Warning] NEO_PRIVATE_KEY not configured - returning mock transaction ID")
+        print("[Info] To enable real Neo transactions, add to extraction/.env:")
+        print("  NEO_NETWORK=testnet")
+        print("  NEO_PRIVATE_KEY=your_wif_private_key")
+        return False
+
+    return True
+
+
+def _print_attestation(result: Dict[str, Any]) -> None:
+    """Print the summary of a written attestation."""
+    # Single write for the whole summary
+    print(
+        f"[Neo] Successfully wrote attestation!\n"
+        f"[Neo] Transaction ID: {result['tx_id']}\n"
+        f"[Neo] Block: {result.get('included_in_block', 'pending')}\n"
+        f"[Neo] Confirmations: {result.get('confirmations', 0)}\n"
+        f"[Neo] GAS consumed: {result.get('gas_consumed', 'N/A')}\n"
+        f"[Neo] Explorer: {get_explorer_url(result['tx_id'], NEO_NETWORK)}"
+    )
+
+
 def write_hypothesis_receipt(hypothesis_id: str, content_hash: str, author_wallet: str) -> str:
     """
     Write a hypothesis receipt to Neo blockchain.
@@ -397,40 +751,48 @@ def write_hypothesis_receipt(hypothesis_id: str, content_hash: str, author_walle
     Returns:
         str: Transaction ID (hex string with 0x prefix)
     """
-    if not NEO_AVAILABLE:
-        print("[Warning] Neo SDK not available - returning mock transaction ID")
+    if not _receipts_configured():
         return _generate_mock_tx_id(hypothesis_id, content_hash, author_wallet)
 
-    if not NEO_PRIVATE_KEY:
-        print("[Warning] NEO_PRIVATE_KEY not configured - returning mock transaction ID")
-        print("[Info] To enable real Neo transactions, add to extraction/.env:")
-        print("  NEO_NETWORK=testnet")
-        print("  NEO_PRIVATE_KEY=your_wif_private_key")
+    try:
+        # Write attestation with the shared client and event loop
+        result = _run_with_shared_client(
+            lambda client: client.write_attestation(hypothesis_id, content_hash, author_wallet)
+        )
+        _print_attestation(result)
+        return result["tx_id"]
+
+    except Exception as e:
+        print(f"[Neo] Error writing to blockchain: {e}")
+        print("[Neo] Falling back to mock transaction ID")
         return _generate_mock_tx_id(hypothesis_id, content_hash, author_wallet)
 
-    try:
-        # Create client and write attestation
-        client = NeoClient()
 
-        # Run async function in event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(
-                client.write_attestation(hypothesis_id, content_hash, author_wallet)
-            )
+async def write_hypothesis_receipt_async(hypothesis_id: str, content_hash: str, author_wallet: str) -> str:
+    """
+    Write a hypothesis receipt to Neo blockchain from an async context.
+
+    Same behaviour as write_hypothesis_receipt, but the attestation is awaited
+    on the caller's event loop instead of blocking a thread on the shared
+    loop. RPC connections are not pooled on caller loops, so nothing is
+    left open when that loop shuts down.
 
-            print(f"[Neo] Successfully wrote attestation!")
-            print(f"[Neo] Transaction ID: {result['tx_id']}")
-            print(f"[Neo] Block: {result.get('included_in_block', 'pending')}")
-            print(f"[Neo] Confirmations: {result.get('confirmations', 0)}")
-            print(f"[Neo] GAS consumed: {result.get('gas_consumed', 'N/A')}")
-            print(f"[Neo] Explorer: {get_explorer_url(result['tx_id'], NEO_NETWORK)}")
+    Args:
+        hypothesis_id: Unique hypothesis identifier
+        content_hash: SHA-256 hash of the hypothesis content
+        author_wallet: Neo wallet address of the author
 
-            return result["tx_id"]
+    Returns:
+        str: Transaction ID (hex string with 0x prefix)
+    """
+    if not _receipts_configured():
+        return _generate_mock_tx_id(hypothesis_id, content_hash, author_wallet)
 
-        finally:
-            loop.close()
+    try:
+        client = _shared_client()
+        result = await client.write_attestation(hypothesis_id, content_hash, author_wallet)
+        _print_attestation(result)
+        return result["tx_id"]
 
     except Exception as e:
         print(f"[Neo] Error writing to blockchain: {e}")
@@ -438,6 +800,42 @@ def write_hypothesis_receipt(hypothesis_id: str, content_hash: str, author_walle
         return _generate_mock_tx_id(hypothesis_id, content_hash, author_wallet)
 
 
+def write_hypothesis_receipts_batch(items: List[Tuple[str, str, str]]) -> List[str]:
+    """
+    Write receipts for several hypotheses to Neo blockchain in one transaction.
+
+    Batch counterpart of write_hypothesis_receipt: all attestations go out
+    in a single invocation.
+
+    Args:
+        items: List of (hypothesis_id, content_hash, author_wallet) tuples
+
+    Returns:
+        list: Transaction IDs (hex strings with 0x prefix), in input order
+    """
+    if not items:
+        return []
+
+    if not NEO_AVAILABLE or not NEO_PRIVATE_KEY:
+        print("[Warning] Neo not available or not configured - returning mock transaction IDs")
+        return [_generate_mock_tx_id(*item) for item in items]
+
+    try:
+        results = _run_with_shared_client(lambda client: client.write_attestations_batch(items))
+
+        tx_id = results[0]["tx_id"]
+        print(f"[Neo] Successfully wrote {len(results)} attestations in one transaction!")
+        print(f"[Neo] Transaction ID: {tx_id}")
+        print(f"[Neo] Explorer: {get_explorer_url(tx_id, NEO_NETWORK)}")
+
+        return [result["tx_id"] for result in results]
+
+    except Exception as e:
+        print(f"[Neo] Error writing batch to blockchain: {e}")
+        print("[Neo] Falling back to mock transaction IDs")
+        return [_generate_mock_tx_id(*item) for item in items]
+
+
 def get_receipt(neo_tx_id: str) -> Optional[dict]:
     """
     Retrieve a hypothesis receipt from Neo blockchain.
@@ -452,14 +850,7 @@ def get_receipt(neo_tx_id: str) -> Optional[dict]:
         return None
 
     try:
-        client = NeoClient()
-
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(client.get_attestation(neo_tx_id))
-        finally:
-            loop.close()
+        return _run_with_shared_client(lambda client: client.get_attestation(neo_tx_id))
 
     except Exception as e:
         print(f"[Neo] Error getting receipt: {e}")
@@ -473,23 +864,27 @@ def _generate_mock_tx_id(hypothesis_id: str, content_hash: str, author_wallet: s
     Used when Neo SDK is not available or not configured.
     The mock ID is based on the input data, making it reproducible.
     """
-    payload = {
-        "hypothesis_id": hypothesis_id,
-        "content_hash": content_hash,
-        "author_wallet": author_wallet,
-        "timestamp": datetime.now(timezone.utc).isoformat()
-    }
+    print(
+        f"[Neo] Mock receipt for hypothesis {hypothesis_id}\n"
+        f"[Neo] Content hash: {content_hash}\n"
+        f"[Neo] Author: {author_wallet}"
+    )
 
-    print(f"[Neo] Mock receipt for hypothesis {hypothesis_id}")
-    print(f"[Neo] Content hash: {content_hash}")
-    print(f"[Neo] Author: {author_wallet}")
+    return _mock_tx_hash(hypothesis_id, content_hash, author_wallet)
 
-    # Generate deterministic hash for mock tx ID
-    mock_hash = hashlib.sha256(
-        json.dumps(payload, sort_keys=True).encode()
-    ).hexdigest()
 
-    return f"0x{mock_hash}"
+@functools.lru_cache(maxsize=1024)
+def _mock_tx_hash(hypothesis_id: str, content_hash: str, author_wallet: str) -> str:
+    """Hash the attestation fields into a mock tx ID (memoized for repeat mints)."""
+    # Fields are fed to the hasher directly (NUL-separated) rather than
+    # building and serializing an intermediate dict. BLAKE2b is faster than
+    # SHA-256 on short inputs; a 32-byte digest keeps the 64-hex-char tx shape.
+    hasher = hashlib.blake2b(digest_size=32)
+    for field in (hypothesis_id, content_hash, author_wallet):
+        hasher.update(field.encode("utf-8"))
+        hasher.update(b"\x00")
+
+    return f"0x{hasher.hexdigest()}"
 
 
 def get_explorer_url(tx_id: str, network: str = "testnet") -> str:
@@ -505,13 +900,9 @@ def get_explorer_url(tx_id: str, network: str = "testnet") -> str:
     Returns:
         str: URL to view transaction on Dora explorer
     """
-    # Remove 0x prefix if present
-    tx_hash = tx_id[2:] if tx_id.startswith("0x") else tx_id
-
-    if network == "mainnet":
-        return f"https://dora.coz.io/transaction/neo3/mainnet/{tx_hash}"
-    else:
-        return f"https://dora.coz.io/transaction/neo3/testnet/{tx_hash}"
+    # Unknown networks fall back to testnet
+    template = _EXPLORER_TX_URLS.get(network, _EXPLORER_TX_URLS["testnet"])
+    return template.format(tx_id.removeprefix("0x"))
 
 
 def verify_attestation(hypothesis_id: str, content_hash: str, tx_id: str) -> bool:
@@ -2,14 +2,155 @@
 Phase 4: Off-Chain Registry Store
 
 Simple file-based storage for HypothesisCards.
+
+A sidecar SQLite index (data/hypotheses/_index.sqlite) maps each card
+file to its filterable fields so filtered listings only open the matching
+card files. Each entry records the file's mtime and size, so files added,
+removed, edited or replaced on disk are re-indexed before a query.
 """
+import atexit
 import json
+import functools
+import hashlib
+import logging
+import logging.handlers
+import math
+import mmap
 import os
-from typing import Dict, Any, List, Optional
+import re
+import sys
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Callable, Set, Tuple
 from pathlib import Path
 
+# Prefer orjson (C extension) for card (de)serialization; stdlib json fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional zstd compression of card files
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
 
 REGISTRY_DIR = "data/hypotheses"
+INDEX_FILENAME = "_index.sqlite"
+INDEX_SCHEMA_VERSION = 2
+
+CARD_SUFFIX = ".json"
+COMPRESSED_CARD_SUFFIX = ".json.zst"
+
+# Set TRACE_REGISTRY_COMPRESSION=zstd to store cards as {hypothesis_id}.json.zst.
+# Once enough cards exist, a shared zstd dictionary is trained from them and
+# persisted next to the cards, so the common key boilerplate compresses well.
+ZSTD_DICT_FILENAME = "_zstd.dict"
+ZSTD_DICT_SIZE = 64 * 1024
+ZSTD_DICT_MIN_SAMPLES = 32
+ZSTD_DICT_MIN_SAMPLE_BYTES = 8 * ZSTD_DICT_SIZE
+ZSTD_LEVEL = 3
+
+# Card files larger than this are memory-mapped when loading
+MMAP_THRESHOLD_BYTES = 64 * 1024
+
+# Batches of at least this many card files are read/written on a thread pool
+PARALLEL_IO_THRESHOLD = 16
+IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Fingerprint and (mtime_ns, size) of the last content written per card file,
+# keyed by absolute path, used to skip rewriting identical cards (e.g.
+# minting retries). An entry is only trusted while the file's stat still
+# matches. Bounded LRU.
+_WRITTEN_FINGERPRINTS: "OrderedDict[str, Tuple[bytes, int, int]]" = OrderedDict()
+_WRITTEN_FINGERPRINTS_MAX = 1024
+
+# Card file listings, keyed by absolute registry path, reused while the
+# directory's mtime is unchanged. As with git's racy-index rule, a listing
+# (or an index/fingerprint file stamp) is only recorded when the mtime is at
+# least one timestamp tick older than the time of recording; otherwise a
+# later change in the same tick could leave the mtime unchanged. The window
+# covers the coarsest common granularity (FAT/exFAT 2 s; HFS+ and many
+# SMB/NFS mounts 1 s).
+_CARD_LISTINGS: Dict[str, Tuple[int, Tuple[str, ...]]] = {}
+_LISTING_RACY_NS = 2_000_000_000
+
+# Index files whose schema this process has already created or checked
+_INDEX_READY: Set[str] = set()
+
+# Loaded zstd dictionaries, keyed by dictionary file path
+_ZSTD_DICTS: Dict[str, Any] = {}
+
+# Card writes left before the registry is scanned again for dictionary
+# training, keyed by dictionary file path. Each write adds at most one card,
+# so after a scan of n cards nothing can change until enough writes reach
+# the next target: ZSTD_DICT_MIN_SAMPLES, or 2n after a failed or undersized
+# attempt.
+_ZSTD_TRAIN_COUNTDOWN: Dict[str, int] = {}
+_ZSTD_TRAIN_LOCK = threading.Lock()
+
+logger = logging.getLogger("trace.registry")
+
+# Buffer writing registry messages to stdout; installed by applications via
+# start_log_buffer()
+_log_buffer: Optional[logging.handlers.MemoryHandler] = None
+
+
+def start_log_buffer() -> None:
+    """
+    Write registry messages to stdout in batches instead of one write each.
+    
+    Call once during application setup. The buffer is flushed at the end of
+    every public save/list call, on WARNING or above, and when full. Calling
+    it again is a no-op; the buffer is flushed and removed at interpreter
+    exit if stop_log_buffer() was not called.
+    """
+    global _log_buffer
+    if _log_buffer is not None:
+        return
+    _log_buffer = logging.handlers.MemoryHandler(
+        capacity=256,
+        flushLevel=logging.WARNING,
+        target=logging.StreamHandler(sys.stdout)
+    )
+    logger.addHandler(_log_buffer)
+    logger.setLevel(logging.INFO)
+    atexit.register(stop_log_buffer)
+
+
+def stop_log_buffer() -> None:
+    """Flush buffered registry messages and remove the buffer (application shutdown)."""
+    global _log_buffer
+    if _log_buffer is None:
+        return
+    logger.removeHandler(_log_buffer)
+    _log_buffer.close()
+    _log_buffer = None
+
+
+def flush_logs() -> None:
+    """Write out buffered registry log messages (call at batch boundaries)."""
+    for handler in logger.handlers:
+        handler.flush()
+
+
+def _flushes_logs(func: Callable) -> Callable:
+    """Flush buffered registry messages when func returns or raises (a batch boundary)."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            flush_logs()
+    return wrapper
 
 
 def _ensure_registry_dir():
@@ -17,95 +158,736 @@ def _ensure_registry_dir():
     Path(REGISTRY_DIR).mkdir(parents=True, exist_ok=True)
 
 
+def _tmp_path(file_path: str) -> str:
+    """Per-process, per-thread temporary path a file is written to before being renamed."""
+    return f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+def _write_tmp_file(file_path: str, payload: bytes, tmp_path: Optional[str] = None) -> str:
+    """
+    Write payload to a fsynced temporary file next to file_path; returns its path.
+    
+    tmp_path defaults to the calling thread's _tmp_path(file_path); pass it
+    explicitly when writing on a worker thread for another thread.
+    """
+    tmp_path = tmp_path or _tmp_path(file_path)
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    return tmp_path
+
+
+def _fsync_registry_dir() -> None:
+    """fsync the registry directory so completed renames survive a crash."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return  # Not supported on Windows; os.replace is still atomic there
+    fd = os.open(REGISTRY_DIR, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+# A run of 19+ digits may be an int outside orjson's 64-bit range (which it
+# would read back as a float). Digits inside strings also match; those cards
+# just take the stdlib parser.
+_WIDE_INT_CANDIDATE_RE = re.compile(rb"[0-9]{19}")
+
+
+def _has_non_finite_float(value: Any) -> bool:
+    """Whether a card value contains NaN or +/-Infinity at any depth."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite_float(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite_float(v) for v in value)
+    return False
+
+
+def _dumps_card(card: Dict[str, Any]) -> bytes:
+    """
+    Serialize a card to indented UTF-8 JSON bytes.
+    
+    orjson rejects ints wider than 64 bits and writes NaN/Infinity as null,
+    so those cards are written by the stdlib encoder, as they always were.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            data = orjson.dumps(card, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            data = None
+        # Only a card whose output has a null can have lost a NaN
+        if data is not None and not (b"null" in data and _has_non_finite_float(card)):
+            return data
+    return json.dumps(card, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _loads_card(data: bytes) -> Dict[str, Any]:
+    """
+    Deserialize card JSON bytes.
+    
+    orjson rejects NaN/Infinity and reads ints wider than 64 bits as floats;
+    stdlib json parses those cards as before.
+    """
+    if ORJSON_AVAILABLE and _WIDE_INT_CANDIDATE_RE.search(data) is None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _compression_enabled() -> bool:
+    """Whether new card files are written zstd-compressed."""
+    # Read at call time: .env is loaded by modules imported after this one
+    return ZSTD_AVAILABLE and os.getenv("TRACE_REGISTRY_COMPRESSION", "").lower() == "zstd"
+
+
+def _is_card_file(filename: str) -> bool:
+    """Whether a registry directory entry name is a card file."""
+    return filename.endswith(CARD_SUFFIX) or filename.endswith(COMPRESSED_CARD_SUFFIX)
+
+
+def _card_path(hypothesis_id: str) -> str:
+    """Path a card is written to under the current compression setting."""
+    suffix = COMPRESSED_CARD_SUFFIX if _compression_enabled() else CARD_SUFFIX
+    return os.path.join(REGISTRY_DIR, f"{hypothesis_id}{suffix}")
+
+
+def _find_card_path(hypothesis_id: str) -> Optional[str]:
+    """Path of the existing card file for a hypothesis, in either format."""
+    preferred = _card_path(hypothesis_id)
+    if os.path.exists(preferred):
+        return preferred
+    for suffix in (CARD_SUFFIX, COMPRESSED_CARD_SUFFIX):
+        candidate = os.path.join(REGISTRY_DIR, f"{hypothesis_id}{suffix}")
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+def _zstd_dict() -> Optional["zstandard.ZstdCompressionDict"]:
+    """Load the registry's trained zstd dictionary, if one exists."""
+    dict_path = os.path.join(REGISTRY_DIR, ZSTD_DICT_FILENAME)
+    if dict_path in _ZSTD_DICTS:
+        return _ZSTD_DICTS[dict_path]
+    if not os.path.exists(dict_path):
+        return None
+    with open(dict_path, "rb") as f:
+        _ZSTD_DICTS[dict_path] = zstandard.ZstdCompressionDict(f.read())
+    return _ZSTD_DICTS[dict_path]
+
+
+def _maybe_train_zstd_dict() -> None:
+    """Train and persist a zstd dictionary once enough card data is stored."""
+    if _zstd_dict() is not None:
+        return
+    
+    dict_path = os.path.join(REGISTRY_DIR, ZSTD_DICT_FILENAME)
+    with _ZSTD_TRAIN_LOCK:
+        remaining = _ZSTD_TRAIN_COUNTDOWN.get(dict_path, 0)
+        if remaining > 0:
+            _ZSTD_TRAIN_COUNTDOWN[dict_path] = remaining - 1
+            return
+    
+    with os.scandir(REGISTRY_DIR) as entries:
+        card_files = [e for e in entries if _is_card_file(e.name) and e.is_file()]
+    
+    def _retry_at(target: int) -> None:
+        # This call's own card is written after the scan
+        with _ZSTD_TRAIN_LOCK:
+            _ZSTD_TRAIN_COUNTDOWN[dict_path] = max(target - len(card_files) - 1, 0)
+    
+    if len(card_files) < ZSTD_DICT_MIN_SAMPLES:
+        _retry_at(ZSTD_DICT_MIN_SAMPLES)
+        return
+    # On-disk sizes (compressed for .zst cards) understate the samples
+    if sum(e.stat().st_size for e in card_files) < ZSTD_DICT_MIN_SAMPLE_BYTES:
+        _retry_at(2 * len(card_files))
+        return
+    
+    try:
+        samples = [_read_card_bytes(e.path) for e in card_files]
+        trained = zstandard.train_dictionary(ZSTD_DICT_SIZE, samples)
+    except Exception as e:
+        logger.warning(f"[Warning] Failed to train zstd dictionary: {e}")
+        _retry_at(2 * len(card_files))
+        return
+    
+    os.replace(_write_tmp_file(dict_path, trained.as_bytes()), dict_path)
+    _ZSTD_DICTS[dict_path] = trained
+    logger.info(f"[Registry] Trained zstd dictionary from {len(samples)} cards")
+
+
+def _compress_card(data: bytes) -> bytes:
+    """zstd-compress serialized card bytes (with the trained dictionary if any)."""
+    dict_data = _zstd_dict()
+    if dict_data is not None:
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL, dict_data=dict_data).compress(data)
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+
+
+def _decompress_card(data: bytes) -> bytes:
+    """Decompress a zstd card frame, using the dictionary only if the frame needs it."""
+    if not ZSTD_AVAILABLE:
+        raise RuntimeError("zstandard is required to read compressed cards")
+    if zstandard.get_frame_parameters(data).dict_id:
+        return zstandard.ZstdDecompressor(dict_data=_zstd_dict()).decompress(data)
+    return zstandard.ZstdDecompressor().decompress(data)
+
+
+def _read_card_bytes(file_path: str) -> bytes:
+    """Read a card file's serialized JSON bytes, decompressing if needed."""
+    with open(file_path, "rb") as f:
+        data = f.read()
+    if file_path.endswith(COMPRESSED_CARD_SUFFIX):
+        return _decompress_card(data)
+    return data
+
+
+def _load_card_file(file_path: str) -> Dict[str, Any]:
+    """
+    Load a card file from disk.
+    
+    Large files are memory-mapped and parsed in place by orjson, avoiding an
+    intermediate copy of the whole file; small files use a plain read.
+    """
+    if file_path.endswith(COMPRESSED_CARD_SUFFIX):
+        return _loads_card(_read_card_bytes(file_path))
+    
+    if ORJSON_AVAILABLE and os.path.getsize(file_path) > MMAP_THRESHOLD_BYTES:
+        with open(file_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if _WIDE_INT_CANDIDATE_RE.search(mm) is None:
+                    with memoryview(mm) as view:
+                        try:
+                            return orjson.loads(view)
+                        except orjson.JSONDecodeError:
+                            pass  # e.g. NaN; the plain read below uses stdlib json
+    
+    with open(file_path, "rb") as f:
+        return _loads_card(f.read())
+
+
+def _try_load_card_file(filename: str) -> Optional[Dict[str, Any]]:
+    """Load a registry card by filename, returning None (with a warning) on failure."""
+    try:
+        return _load_card_file(os.path.join(REGISTRY_DIR, filename))
+    except Exception as e:
+        logger.warning(f"[Warning] Failed to load {filename}: {e}")
+        return None
+
+
+def _index_path() -> str:
+    """Path of the sidecar filter index for the current REGISTRY_DIR."""
+    return os.path.join(REGISTRY_DIR, INDEX_FILENAME)
+
+
+# Version 1 keyed rows by hypothesis_id and had no file stamps; its tables
+# are dropped. Everything else is idempotent, so concurrent upgrades are safe.
+_INDEX_SCHEMA = f"""
+DROP TABLE IF EXISTS cards;
+DROP TABLE IF EXISTS card_vars;
+CREATE TABLE IF NOT EXISTS card_files (
+    filename TEXT PRIMARY KEY,
+    hypothesis_id TEXT,
+    primary_synergy_id TEXT,
+    confidence TEXT,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_card_files_synergy_confidence ON card_files (primary_synergy_id, confidence);
+CREATE INDEX IF NOT EXISTS idx_card_files_confidence ON card_files (confidence);
+CREATE TABLE IF NOT EXISTS card_file_vars (
+    filename TEXT NOT NULL,
+    var TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_card_file_vars_var ON card_file_vars (var);
+CREATE INDEX IF NOT EXISTS idx_card_file_vars_file ON card_file_vars (filename);
+PRAGMA user_version = {INDEX_SCHEMA_VERSION};
+"""
+
+
+def _connect_index() -> sqlite3.Connection:
+    """
+    Open the filter index, creating (or upgrading) the schema if needed.
+    
+    The schema is checked once per index path per process; callers that hit
+    a sqlite3.Error call _forget_index_schema() so it is checked again (e.g.
+    if the index file was deleted).
+    """
+    index_path = _index_path()
+    conn = sqlite3.connect(index_path)
+    if index_path not in _INDEX_READY:
+        if conn.execute("PRAGMA user_version").fetchone()[0] != INDEX_SCHEMA_VERSION:
+            conn.executescript(_INDEX_SCHEMA)
+        _INDEX_READY.add(index_path)
+    return conn
+
+
+def _forget_index_schema() -> None:
+    """Re-check the current index's schema on its next connection."""
+    _INDEX_READY.discard(_index_path())
+
+
+def _card_variables(card: Dict[str, Any]) -> List[str]:
+    """
+    A card's source_support.variables_used, tolerating malformed cards.
+    
+    Returns:
+        The string entries of variables_used, or [] if source_support or
+        variables_used has the wrong type
+    """
+    source_support = card.get("source_support")
+    if not isinstance(source_support, dict):
+        return []
+    variables = source_support.get("variables_used")
+    if not isinstance(variables, list):
+        return []
+    return [var for var in variables if isinstance(var, str)]
+
+
+def _index_scalar(value: Any) -> Any:
+    """A field value as stored in the index (None unless SQLite can bind it)."""
+    return value if isinstance(value, (str, int, float)) else None
+
+
+def _file_stamp(stat: os.stat_result) -> Tuple[int, int]:
+    """
+    (mtime_ns, size) recorded for an indexed file.
+    
+    A file whose mtime is within one timestamp tick (_LISTING_RACY_NS) of
+    now gets mtime -1, so it is checked again on the next sync rather than
+    trusted: a later edit landing in the same tick with the same size would
+    otherwise go unnoticed.
+    """
+    if time.time_ns() - stat.st_mtime_ns <= _LISTING_RACY_NS:
+        return -1, stat.st_size
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _index_card_file(
+    conn: sqlite3.Connection,
+    filename: str,
+    card: Optional[Dict[str, Any]],
+    stat: os.stat_result
+) -> None:
+    """
+    Upsert a card file's filterable fields into the index (caller commits).
+    
+    Args:
+        conn: Index connection
+        filename: Card file name within REGISTRY_DIR
+        card: Parsed card, or None if the file could not be loaded (recorded
+            with no fields, so it matches no filter until it changes)
+        stat: os.stat() of the card file as read
+    """
+    card = card if isinstance(card, dict) else {}
+    mtime_ns, size = _file_stamp(stat)
+    conn.execute(
+        "INSERT OR REPLACE INTO card_files "
+        "(filename, hypothesis_id, primary_synergy_id, confidence, mtime_ns, size) VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            filename,
+            _index_scalar(card.get("hypothesis_id")),
+            _index_scalar(card.get("primary_synergy_id")),
+            _index_scalar(card.get("confidence")),
+            mtime_ns,
+            size
+        )
+    )
+    conn.execute("DELETE FROM card_file_vars WHERE filename = ?", (filename,))
+    conn.executemany(
+        "INSERT INTO card_file_vars (filename, var) VALUES (?, ?)",
+        [(filename, var) for var in set(_card_variables(card))]
+    )
+
+
+def _sync_index(conn: sqlite3.Connection, card_files: List[str]) -> None:
+    """
+    Bring the filter index in line with the card files on disk.
+    
+    Files whose (mtime, size) differ from the indexed stamp, including new
+    files, are re-read and re-indexed; entries for files no longer listed
+    are dropped. Unchanged files cost one stat each.
+    """
+    indexed = {
+        filename: (mtime_ns, size)
+        for filename, mtime_ns, size in conn.execute("SELECT filename, mtime_ns, size FROM card_files")
+    }
+    listed = set(card_files)
+    removed = [filename for filename in indexed if filename not in listed]
+    changed = []
+    for filename in card_files:
+        try:
+            stat = os.stat(os.path.join(REGISTRY_DIR, filename))
+        except FileNotFoundError:
+            if filename in indexed:
+                removed.append(filename)
+            continue
+        if indexed.get(filename) != (stat.st_mtime_ns, stat.st_size):
+            changed.append((filename, stat))
+    
+    if not removed and not changed:
+        return
+    
+    with conn:
+        for filename in removed:
+            conn.execute("DELETE FROM card_files WHERE filename = ?", (filename,))
+            conn.execute("DELETE FROM card_file_vars WHERE filename = ?", (filename,))
+        for filename, stat in changed:
+            card = _try_load_card_file(filename)
+            _index_card_file(conn, filename, card, stat)
+
+
+def _query_index(conn: sqlite3.Connection, filters: Dict[str, Any]) -> List[str]:
+    """Return the names of card files whose indexed fields match the filters."""
+    clauses = []
+    params: List[Any] = []
+    
+    if "variables_used" in filters:
+        filter_vars = list(filters["variables_used"])
+        placeholders = ",".join("?" * len(filter_vars))
+        clauses.append(
+            "EXISTS (SELECT 1 FROM card_file_vars v WHERE v.filename = c.filename "
+            f"AND v.var IN ({placeholders}))"
+        )
+        params.extend(filter_vars)
+    
+    if "primary_synergy_id" in filters:
+        clauses.append("c.primary_synergy_id IS ?")
+        params.append(filters["primary_synergy_id"])
+    
+    if "confidence" in filters:
+        clauses.append("c.confidence IS ?")
+        params.append(filters["confidence"])
+    
+    query = "SELECT c.filename FROM card_files c"
+    if clauses:
+        query += " WHERE " + " AND ".join(clauses)
+    
+    return [row[0] for row in conn.execute(query, params)]
+
+
+def _compile_filters(filters: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Build a card predicate for list_hypotheses filters.
+    
+    Filter values are resolved once up front (variables_used as a frozenset)
+    so the per-card check is only membership and equality tests.
+    """
+    filter_vars = frozenset(filters["variables_used"]) if "variables_used" in filters else None
+    check_synergy = "primary_synergy_id" in filters
+    target_synergy = filters.get("primary_synergy_id")
+    check_confidence = "confidence" in filters
+    target_confidence = filters.get("confidence")
+    
+    def matches(card: Dict[str, Any]) -> bool:
+        # Filter by variables_used
+        if filter_vars is not None:
+            if filter_vars.isdisjoint(_card_variables(card)):
+                return False
+        
+        # Filter by primary_synergy_id
+        if check_synergy and card.get("primary_synergy_id") != target_synergy:
+            return False
+        
+        # Filter by confidence
+        if check_confidence and card.get("confidence") != target_confidence:
+            return False
+        
+        return True
+    
+    return matches
+
+
+@_flushes_logs
 def save_hypothesis(card: Dict[str, Any]) -> None:
     """
     Save a HypothesisCard to the off-chain registry.
     
     Stores as JSON file: data/hypotheses/{hypothesis_id}.json
+    (or {hypothesis_id}.json.zst with TRACE_REGISTRY_COMPRESSION=zstd)
+    
+    The card is written to a fsynced temporary file and renamed into place,
+    so a crash mid-write never leaves a partial card file behind. Unlike
+    save_hypotheses_batch(), the single-card path skips the directory fsync:
+    one fsync per card.
     
     Args:
         card: HypothesisCard dict (may include metadata like content_hash, created_at, etc.)
     """
     _ensure_registry_dir()
     
+    write = _prepare_card_write(card)
+    if write is None:
+        return
+    
+    hypothesis_id, file_path, payload, fingerprint = write
+    try:
+        os.replace(_write_tmp_file(file_path, payload), file_path)
+    except Exception:
+        # Leave no temporary file behind; the existing card is untouched
+        tmp_path = _tmp_path(file_path)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    
+    _index_written_cards([write], {hypothesis_id: card})
+    _finish_card_write(hypothesis_id, file_path, fingerprint)
+    
+    logger.info(f"[Registry] Saved hypothesis {hypothesis_id} to {file_path}")
+
+
+@_flushes_logs
+def save_hypotheses_batch(cards: List[Dict[str, Any]]) -> None:
+    """
+    Save several HypothesisCards to the off-chain registry.
+    
+    All temporary files are written and fsynced first (on a thread pool for
+    larger batches), then renamed into place with a single directory fsync
+    and a single index transaction, instead of paying those costs per card.
+    If the same hypothesis_id appears more than once, the last card wins.
+    
+    Args:
+        cards: List of HypothesisCard dicts
+    """
+    _ensure_registry_dir()
+    
+    latest: Dict[str, Dict[str, Any]] = {}
+    for card in cards:
+        hypothesis_id = card.get("hypothesis_id")
+        if not hypothesis_id:
+            raise ValueError("HypothesisCard must have hypothesis_id")
+        latest[hypothesis_id] = card
+    
+    writes = [w for w in map(_prepare_card_write, latest.values()) if w is not None]
+    if not writes:
+        return
+    
+    # Named on this thread, so cleanup finds files written by pool workers
+    tmp_paths = [_tmp_path(file_path) for _, file_path, _, _ in writes]
+    try:
+        if len(writes) < PARALLEL_IO_THRESHOLD:
+            for (_, file_path, payload, _), tmp_path in zip(writes, tmp_paths):
+                _write_tmp_file(file_path, payload, tmp_path)
+        else:
+            with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+                list(executor.map(
+                    lambda write, tmp_path: _write_tmp_file(write[1], write[2], tmp_path),
+                    writes,
+                    tmp_paths
+                ))
+    except Exception:
+        # Leave no temporary files behind; existing cards are untouched
+        for tmp_path in tmp_paths:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        raise
+    
+    for (_, file_path, _, _), tmp_path in zip(writes, tmp_paths):
+        os.replace(tmp_path, file_path)
+    _fsync_registry_dir()
+    
+    _index_written_cards(writes, latest)
+    
+    for hypothesis_id, file_path, _, fingerprint in writes:
+        _finish_card_write(hypothesis_id, file_path, fingerprint)
+    
+    if len(writes) == 1:
+        hypothesis_id, file_path, _, _ = writes[0]
+        logger.info(f"[Registry] Saved hypothesis {hypothesis_id} to {file_path}")
+    else:
+        logger.info(f"[Registry] Saved {len(writes)} hypotheses to {REGISTRY_DIR}")
+
+
+def _index_written_cards(
+    writes: List[Tuple[str, str, bytes, bytes]],
+    cards: Dict[str, Dict[str, Any]]
+) -> None:
+    """
+    Record freshly written card files in the filter index, in one transaction.
+    
+    Args:
+        writes: (hypothesis_id, file_path, payload, fingerprint) per written file
+        cards: The written cards, by hypothesis_id
+    """
+    try:
+        with closing(_connect_index()) as conn:
+            with conn:
+                for hypothesis_id, file_path, _, _ in writes:
+                    _index_card_file(conn, os.path.basename(file_path), cards[hypothesis_id], os.stat(file_path))
+    except (sqlite3.Error, OSError) as e:
+        # The index re-syncs from the card files before the next filtered listing
+        _forget_index_schema()
+        logger.warning(f"[Warning] Failed to update registry index: {e}")
+
+
+def _prepare_card_write(card: Dict[str, Any]) -> Optional[Tuple[str, str, bytes, bytes]]:
+    """
+    Serialize a card for writing.
+    
+    Returns:
+        (hypothesis_id, file_path, payload, fingerprint), or None if the card
+        file already holds this content
+    """
     hypothesis_id = card.get("hypothesis_id")
     if not hypothesis_id:
         raise ValueError("HypothesisCard must have hypothesis_id")
     
-    file_path = os.path.join(REGISTRY_DIR, f"{hypothesis_id}.json")
+    file_path = _card_path(hypothesis_id)
+    
+    # Serialize once; the bytes are both written and fingerprinted
+    data = _dumps_card(card)
+    fingerprint = hashlib.blake2b(data, digest_size=16).digest()
+    
+    if _is_unchanged_on_disk(file_path, fingerprint):
+        _remember_fingerprint(file_path, fingerprint)
+        logger.info(f"[Registry] Hypothesis {hypothesis_id} unchanged, skipping write")
+        return None
+    
+    if _compression_enabled():
+        _maybe_train_zstd_dict()
+        payload = _compress_card(data)
+    else:
+        payload = data
+    
+    return hypothesis_id, file_path, payload, fingerprint
+
+
+def _finish_card_write(hypothesis_id: str, file_path: str, fingerprint: bytes) -> None:
+    """Bookkeeping after a card file has been renamed into place."""
+    # Drop a copy left in the other format by a previous compression setting
+    for suffix in (CARD_SUFFIX, COMPRESSED_CARD_SUFFIX):
+        stale_path = os.path.join(REGISTRY_DIR, f"{hypothesis_id}{suffix}")
+        if stale_path != file_path and os.path.exists(stale_path):
+            os.remove(stale_path)
     
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(card, f, indent=2, ensure_ascii=False)
+    _remember_fingerprint(file_path, fingerprint)
+
+
+def _is_unchanged_on_disk(file_path: str, fingerprint: bytes) -> bool:
+    """
+    Check whether the card file already holds content with this fingerprint.
+    
+    Uses the remembered fingerprint of the last write when the file's
+    (mtime, size) still match what was recorded, and the mtime was already
+    outside the racy window when recorded; otherwise reads the existing
+    file and fingerprints it.
+    """
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        return False
     
-    print(f"[Registry] Saved hypothesis {hypothesis_id} to {file_path}")
+    # A stamp recorded inside the racy window (mtime -1) is never trusted
+    known = _WRITTEN_FINGERPRINTS.get(os.path.abspath(file_path))
+    if known is not None and known[1] != -1 and known[1:] == (stat.st_mtime_ns, stat.st_size):
+        return known[0] == fingerprint
+    
+    try:
+        existing = _read_card_bytes(file_path)
+    except Exception:
+        return False
+    
+    return hashlib.blake2b(existing, digest_size=16).digest() == fingerprint
+
+
+def _remember_fingerprint(file_path: str, fingerprint: bytes) -> None:
+    """Record the fingerprint and current stat of the content in a card file."""
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        return
+    key = os.path.abspath(file_path)
+    _WRITTEN_FINGERPRINTS[key] = (fingerprint, *_file_stamp(stat))
+    _WRITTEN_FINGERPRINTS.move_to_end(key)
+    if len(_WRITTEN_FINGERPRINTS) > _WRITTEN_FINGERPRINTS_MAX:
+        _WRITTEN_FINGERPRINTS.popitem(last=False)
 
 
 def get_hypothesis(hypothesis_id: str) -> Optional[Dict[str, Any]]:
     """
     Retrieve a HypothesisCard from the registry.
     """
-    file_path = os.path.join(REGISTRY_DIR, f"{hypothesis_id}.json")
+    file_path = _find_card_path(hypothesis_id)
     
-    if not os.path.exists(file_path):
+    if file_path is None:
         return None
     
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _load_card_file(file_path)
 
 
+def _list_card_files() -> List[str]:
+    """Names of the card files in REGISTRY_DIR (cached per directory mtime)."""
+    registry_path = os.path.abspath(REGISTRY_DIR)
+    mtime_ns = os.stat(registry_path).st_mtime_ns
+    
+    cached = _CARD_LISTINGS.get(registry_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return list(cached[1])
+    
+    # scandir yields file types from the directory read itself (no per-entry stat)
+    with os.scandir(registry_path) as entries:
+        card_files = [e.name for e in entries if _is_card_file(e.name) and e.is_file()]
+    
+    if time.time_ns() - mtime_ns > _LISTING_RACY_NS:
+        _CARD_LISTINGS[registry_path] = (mtime_ns, tuple(card_files))
+    return card_files
+
+
+@_flushes_logs
 def list_hypotheses(filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """
     List all hypotheses in the registry, optionally filtered.
+    
+    Filtered queries are answered from the sidecar index so only matching
+    card files are read. Before querying, files added, removed or changed
+    on disk since they were indexed are re-indexed; the directory listing
+    itself is reused until the directory changes.
     """
     _ensure_registry_dir()
     
     if not os.path.exists(REGISTRY_DIR):
         return []
     
-    hypotheses = []
-    
-    # Load all hypothesis files
-    for filename in os.listdir(REGISTRY_DIR):
-        if filename.endswith(".json"):
-            file_path = os.path.join(REGISTRY_DIR, filename)
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    card = json.load(f)
-                    hypotheses.append(card)
-            except Exception as e:
-                print(f"[Warning] Failed to load {filename}: {e}")
-                continue
-    
-    # Apply filters if provided
+    card_files = _list_card_files()
+    
     if filters:
-        filtered = []
-        
-        for card in hypotheses:
-            # Filter by variables_used
-            if "variables_used" in filters:
-                card_vars = set(card.get("source_support", {}).get("variables_used", []))
-                filter_vars = set(filters["variables_used"])
-                if not card_vars.intersection(filter_vars):
-                    continue
-            
-            # Filter by primary_synergy_id
-            if "primary_synergy_id" in filters:
-                if card.get("primary_synergy_id") != filters["primary_synergy_id"]:
-                    continue
-            
-            # Filter by confidence
-            if "confidence" in filters:
-                if card.get("confidence") != filters["confidence"]:
-                    continue
-            
-            filtered.append(card)
-        
-        return filtered
+        try:
+            # One connection for the sync and the query
+            with closing(_connect_index()) as conn:
+                _sync_index(conn, card_files)
+                matched_files = _query_index(conn, filters)
+            listed = set(card_files)
+            card_files = [name for name in matched_files if name in listed]
+        except (sqlite3.Error, OSError) as e:
+            _forget_index_schema()
+            logger.warning(f"[Warning] Registry index unavailable, scanning all files: {e}")
+    
+    # Load hypothesis files (in parallel for larger registries)
+    if len(card_files) < PARALLEL_IO_THRESHOLD:
+        loaded = map(_try_load_card_file, card_files)
+    else:
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+            loaded = list(executor.map(_try_load_card_file, card_files))
+    
+    hypotheses = [card for card in loaded if card is not None]
+    
+    # Apply filters if provided (re-checked on loaded cards in case a file
+    # changed between the index sync and the load)
+    if filters:
+        matches = _compile_filters(filters)
+        return [card for card in hypotheses if matches(card)]
     
     return hypotheses
 
 
 if __name__ == "__main__":
+    start_log_buffer()
+    
     # Example usage
     test_card = {
         "hypothesis_id": "trace_hyp_test",
@@ -11,11 +11,25 @@ These integrations satisfy the hackathon requirement:
 Reference: https://github.com/XSpoonAi/spoon-core/tree/main/spoon_ai/tools
 """
 import os
+import re
+import sys
 import json
+import math
+import atexit
+import hashlib
+import logging
+import logging.handlers
+import queue
 import base64
 import asyncio
-from typing import Dict, Any, Optional, Tuple
+import functools
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime, timezone
+from types import SimpleNamespace
 from dotenv import load_dotenv
 
 # Load environment
@@ -23,41 +37,276 @@ script_dir = os.path.dirname(os.path.abspath(__file__))
 env_path = os.path.join(script_dir, "..", "extraction", ".env")
 load_dotenv(env_path)
 
-# Try to import SpoonOS tools
-NEOFS_AVAILABLE = False
-X402_AVAILABLE = False
+# Prefer orjson (C extension) for upload payloads; stdlib json fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
+# Optional zstd compression of upload payloads
 try:
-    from spoon_ai.tools.neofs_tools import (
-        CreateContainerTool,
-        UploadObjectTool,
-        DownloadObjectByIdTool,
-        SearchObjectsTool,
-        GetBalanceTool,
-        ListContainersTool
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger("trace.spoon_tools")
+
+# Listener writing queued tool messages to stdout; started by applications
+# via start_log_listener()
+_log_listener: Optional[logging.handlers.QueueListener] = None
+_log_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
+
+def start_log_listener() -> None:
+    """
+    Write tool messages to stdout from a background listener thread.
+
+    Call once during application setup. Messages are handed to the listener
+    through a queue, so logging from async code never blocks the event loop
+    on console I/O. Calling it again is a no-op; the listener is stopped at
+    interpreter exit if stop_log_listener() was not called.
+    """
+    global _log_listener, _log_queue_handler
+    if _log_listener is not None:
+        return
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    _log_listener.start()
+    _log_queue_handler = logging.handlers.QueueHandler(log_queue)
+    logger.addHandler(_log_queue_handler)
+    logger.setLevel(logging.INFO)
+    atexit.register(stop_log_listener)
+
+
+def stop_log_listener() -> None:
+    """Flush queued tool messages and stop the listener (application shutdown)."""
+    global _log_listener, _log_queue_handler
+    if _log_listener is None:
+        return
+    logger.removeHandler(_log_queue_handler)
+    _log_listener.stop()
+    _log_listener = None
+    _log_queue_handler = None
+
+# SpoonOS tools are imported lazily: the spoon_ai tool modules pull in heavy
+# dependencies, so they are only loaded (and availability only probed) when
+# NeoFS or X402 is first used. NEOFS_AVAILABLE / X402_AVAILABLE remain
+# importable module attributes via __getattr__ below.
+
+@functools.cache
+def _load_neofs_tools() -> Optional[SimpleNamespace]:
+    """Import the SpoonOS NeoFS tool classes once; None if unavailable."""
+    try:
+        from spoon_ai.tools.neofs_tools import (
+            CreateContainerTool,
+            UploadObjectTool,
+            DownloadObjectByIdTool,
+            SearchObjectsTool,
+            GetBalanceTool,
+            ListContainersTool
+        )
+    except ImportError as e:
+        logger.warning(
+            f"[Warning] NeoFS tools not available: {e}\n"
+            "Install spoon-ai-sdk with NeoFS support"
+        )
+        return None
+
+    logger.info("[SpoonOS] NeoFS tools loaded successfully")
+    return SimpleNamespace(
+        CreateContainerTool=CreateContainerTool,
+        UploadObjectTool=UploadObjectTool,
+        DownloadObjectByIdTool=DownloadObjectByIdTool,
+        SearchObjectsTool=SearchObjectsTool,
+        GetBalanceTool=GetBalanceTool,
+        ListContainersTool=ListContainersTool
     )
-    NEOFS_AVAILABLE = True
-    print("[SpoonOS] NeoFS tools loaded successfully")
-except ImportError as e:
-    print(f"[Warning] NeoFS tools not available: {e}")
-    print("Install spoon-ai-sdk with NeoFS support")
 
-try:
-    from spoon_ai.tools.x402_payment import (
-        X402PaymentHeaderTool,
-        X402PaywalledRequestTool
+
+@functools.cache
+def _load_x402_tools() -> Optional[SimpleNamespace]:
+    """Import the SpoonOS X402 tool classes once; None if unavailable."""
+    try:
+        from spoon_ai.tools.x402_payment import (
+            X402PaymentHeaderTool,
+            X402PaywalledRequestTool
+        )
+    except ImportError as e:
+        logger.warning(
+            f"[Warning] X402 tools not available: {e}\n"
+            "Install spoon-ai-sdk with X402 support"
+        )
+        return None
+
+    logger.info("[SpoonOS] X402 payment tools loaded successfully")
+    return SimpleNamespace(
+        X402PaymentHeaderTool=X402PaymentHeaderTool,
+        X402PaywalledRequestTool=X402PaywalledRequestTool
     )
-    X402_AVAILABLE = True
-    print("[SpoonOS] X402 payment tools loaded successfully")
-except ImportError as e:
-    print(f"[Warning] X402 tools not available: {e}")
-    print("Install spoon-ai-sdk with X402 support")
+
+
+def _neofs_available() -> bool:
+    """Whether the SpoonOS NeoFS tools can be imported."""
+    return _load_neofs_tools() is not None
+
+
+def _x402_available() -> bool:
+    """Whether the SpoonOS X402 tools can be imported."""
+    return _load_x402_tools() is not None
+
+
+def __getattr__(name: str) -> Any:
+    """Probe tool availability on first access of the module-level flags."""
+    if name == "NEOFS_AVAILABLE":
+        return _neofs_available()
+    if name == "X402_AVAILABLE":
+        return _x402_available()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ============================================================================
 # NeoFS Storage Integration
 # ============================================================================
 
+# Maximum concurrent NeoFS uploads in a batch store
+NEOFS_UPLOAD_CONCURRENCY = 8
+
+# NeoFS object attribute layout; static fields are filled once, per-card
+# fields are patched onto a copy
+_OBJECT_ATTRIBUTES_TEMPLATE = {
+    "HypothesisId": "",
+    "ContentHash": "",
+    "Type": "HypothesisCard",
+    "Version": "v1",
+    "CreatedAt": "",
+    "FileName": ""
+}
+
+# Retrieved cards / uploaded object IDs kept in memory per store (LRU)
+NEOFS_RETRIEVE_CACHE_MAX = 1024
+
+# IDs a search just confirmed are absent are answered from memory for this
+# long, so repeated lookups of unknown IDs skip the search round-trip
+NEOFS_MISSING_TTL_SECONDS = 60.0
+NEOFS_MISSING_CACHE_MAX = 4096
+
+
+# Set NEOFS_COMPRESSION=zstd to upload cards zstd-compressed. The tools carry
+# text content, so the compressed frame is base64-encoded; objects are tagged
+# with a ContentEncoding attribute and plain-JSON objects still read back.
+NEOFS_ZSTD_LEVEL = 3
+NEOFS_ZSTD_ENCODING = "zstd+base64"
+_ZSTD_BASE64_MAGIC = "KLUv/"  # base64 of the zstd frame magic number
+
+# 19+ consecutive digits: possibly an int beyond orjson's 64-bit range.
+# Matches digit runs inside strings too, which merely selects stdlib json.
+_WIDE_INT_RUN_RE = re.compile(r"[0-9]{19}")
+
+# Error indicators in the string results returned by SpoonOS NeoFS tools
+_ERROR_RE = re.compile(r"^(?:Error|❌)|Failed|Missing configuration")
+
+
+def _is_error_result(result: Any) -> bool:
+    """Whether a NeoFS tool result is an error message rather than an ID."""
+    return not result or not isinstance(result, str) or _ERROR_RE.search(result) is not None
+
+
+def _neofs_compression_enabled() -> bool:
+    """Whether card uploads are zstd-compressed."""
+    return ZSTD_AVAILABLE and os.getenv("NEOFS_COMPRESSION", "").lower() == "zstd"
+
+
+def _has_non_finite_float(value: Any) -> bool:
+    """Whether a card value contains NaN or +/-Infinity at any depth."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite_float(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite_float(v) for v in value)
+    return False
+
+
+def _dumps_payload(card: Dict[str, Any]) -> bytes:
+    """
+    Compact UTF-8 JSON bytes of a card.
+
+    Uses orjson unless it would change what the stdlib encoder uploads:
+    orjson raises on ints wider than 64 bits and turns NaN/Infinity into null.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            data = orjson.dumps(card)
+        except orjson.JSONEncodeError:
+            data = None
+        if data is not None and not (b"null" in data and _has_non_finite_float(card)):
+            return data
+    return json.dumps(card, separators=(',', ':'), ensure_ascii=False).encode("utf-8")
+
+
+def _encode_payload(card: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+    """
+    Serialize a card to compact JSON for upload.
+
+    The card is encoded straight to UTF-8 bytes once; compressed payloads
+    go from those bytes into zstd without an intermediate str copy.
+
+    Returns:
+        (content, ContentEncoding attribute value or None if uncompressed)
+    """
+    data = _dumps_payload(card)
+    if _neofs_compression_enabled():
+        compressed = zstandard.ZstdCompressor(level=NEOFS_ZSTD_LEVEL).compress(data)
+        return base64.b64encode(compressed).decode("ascii"), NEOFS_ZSTD_ENCODING
+    return data.decode("utf-8"), None
+
+
+def _loads_payload(content: str) -> Dict[str, Any]:
+    """
+    Deserialize a downloaded card payload (plain or zstd+base64).
+
+    Payloads with NaN/Infinity (which orjson rejects) or a possible int wider
+    than 64 bits (which orjson reads as a float) are parsed by stdlib json.
+    """
+    if content.startswith(_ZSTD_BASE64_MAGIC):
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("Object is zstd-compressed; install zstandard to read it")
+        content = zstandard.ZstdDecompressor().decompress(base64.b64decode(content)).decode("utf-8")
+    if ORJSON_AVAILABLE and _WIDE_INT_RUN_RE.search(content) is None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+def _payload_fingerprint(content: str) -> str:
+    """Fingerprint the exact encoded upload payload (used to skip re-uploads)."""
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_neofs_tools() -> Dict[str, Any]:
+    """
+    Create the SpoonOS NeoFS tools once per process.
+
+    Every NeoFSHypothesisStore reuses these instances, so whatever gateway
+    client/connection state the tools keep is set up once instead of per
+    store. Raises if the tools cannot be constructed (not cached then).
+    """
+    tools = _load_neofs_tools()
+    return {
+        "create_container_tool": tools.CreateContainerTool(),
+        "upload_tool": tools.UploadObjectTool(),
+        "download_tool": tools.DownloadObjectByIdTool(),
+        "search_tool": tools.SearchObjectsTool(),
+        "balance_tool": tools.GetBalanceTool(),
+        "list_containers_tool": tools.ListContainersTool()
+    }
+
+
 class NeoFSHypothesisStore:
     """
     NeoFS-based storage for hypothesis data.
@@ -69,6 +318,25 @@ class NeoFSHypothesisStore:
     "Use at least one Tool module from the official Spoon-toolkit"
     """
 
+    __slots__ = (
+        "container_id",
+        "endpoint",
+        "wallet_path",
+        "create_container_tool",
+        "upload_tool",
+        "download_tool",
+        "search_tool",
+        "balance_tool",
+        "list_containers_tool",
+        "balance",
+        "_retrieve_cache",
+        "_retrieve_locks",
+        "_missing_until",
+        "_uploaded_objects",
+        "_known_object_ids",
+        "_container_lock"
+    )
+
     def __init__(self, container_id: Optional[str] = None):
         """
         Initialize NeoFS store.
@@ -81,8 +349,26 @@ class NeoFSHypothesisStore:
         self.endpoint = os.getenv("NEOFS_ENDPOINT", "grpc://st1.storage.fs.neo.org:8080")
         self.wallet_path = os.getenv("NEOFS_WALLET_PATH")
 
-        if not NEOFS_AVAILABLE:
-            print("[Warning] NeoFS tools not available. Storage operations will be simulated.")
+        # payload fingerprint -> (container_id, hypothesis_id, object_id) of
+        # real uploads, most recently used last
+        self._uploaded_objects: "OrderedDict[str, Tuple[str, str, str]]" = OrderedDict()
+        # Last balance returned by get_balance()
+        self.balance: Optional[str] = None
+
+        # hypothesis_id -> object ID it last resolved to (speculative downloads)
+        self._known_object_ids: "OrderedDict[str, str]" = OrderedDict()
+        # Serializes container creation in ensure_container
+        self._container_lock = asyncio.Lock()
+
+        # hypothesis_id -> card, most recently used last
+        self._retrieve_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Per-ID locks so concurrent misses for one ID share a single fetch
+        self._retrieve_locks: Dict[str, asyncio.Lock] = {}
+        # hypothesis_id -> monotonic expiry of a confirmed "not found"
+        self._missing_until: "OrderedDict[str, float]" = OrderedDict()
+
+        if not _neofs_available():
+            logger.warning("[Warning] NeoFS tools not available. Storage operations will be simulated.")
 
         # Initialize tools if available
         self.create_container_tool = None
@@ -92,33 +378,45 @@ class NeoFSHypothesisStore:
         self.balance_tool = None
         self.list_containers_tool = None
 
-        if NEOFS_AVAILABLE:
+        if _neofs_available():
             try:
-                self.create_container_tool = CreateContainerTool()
-                self.upload_tool = UploadObjectTool()
-                self.download_tool = DownloadObjectByIdTool()
-                self.search_tool = SearchObjectsTool()
-                self.balance_tool = GetBalanceTool()
-                self.list_containers_tool = ListContainersTool()
-                print("[NeoFS] Tools initialized successfully")
+                tools = _shared_neofs_tools()
+                self.create_container_tool = tools["create_container_tool"]
+                self.upload_tool = tools["upload_tool"]
+                self.download_tool = tools["download_tool"]
+                self.search_tool = tools["search_tool"]
+                self.balance_tool = tools["balance_tool"]
+                self.list_containers_tool = tools["list_containers_tool"]
+                logger.info("[NeoFS] Tools initialized successfully")
             except Exception as e:
-                print(f"[Warning] Failed to initialize NeoFS tools: {e}")
+                logger.warning(f"[Warning] Failed to initialize NeoFS tools: {e}")
 
     async def ensure_container(self) -> str:
         """
         Ensure a container exists for storing hypotheses.
         Creates one if it doesn't exist.
 
+        Concurrent callers share a single creation, so a burst of stores on
+        a fresh store does not create (and pay for) duplicate containers.
+
         Returns:
             str: Container ID
         """
         if self.container_id:
             return self.container_id
 
-        if not NEOFS_AVAILABLE or not self.create_container_tool:
+        async with self._container_lock:
+            # Another caller may have created it while we waited
+            if self.container_id:
+                return self.container_id
+            return await self._create_container()
+
+    async def _create_container(self) -> str:
+        """Create the hypothesis container (caller holds _container_lock)."""
+        if not _neofs_available() or not self.create_container_tool:
             # Simulate container creation
             self.container_id = f"simulated_container_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-            print(f"[NeoFS Simulated] Created container: {self.container_id}")
+            logger.info(f"[NeoFS Simulated] Created container: {self.container_id}")
             return self.container_id
 
         try:
@@ -133,24 +431,16 @@ class NeoFSHypothesisStore:
             )
 
             # Result is a string (container ID or error message)
-            # Check for error indicators
-            is_error = (
-                not result or
-                not isinstance(result, str) or
-                result.startswith("Error") or
-                result.startswith("❌") or
-                "Failed" in result or
-                "Missing configuration" in result
-            )
+            is_error = _is_error_result(result)
 
             if not is_error:
                 self.container_id = result
-                print(f"[NeoFS] Created container: {self.container_id}")
+                logger.info(f"[NeoFS] Created container: {self.container_id}")
                 return self.container_id
             else:
                 raise Exception(f"Container creation failed: {result}")
         except Exception as e:
-            print(f"[Warning] NeoFS container creation failed: {e}")
+            logger.warning(f"[Warning] NeoFS container creation failed: {e}")
             # Fallback to simulated
             self.container_id = f"fallback_container_{datetime.now().strftime('%Y%m%d%H%M%S')}"
             return self.container_id
@@ -171,24 +461,52 @@ class NeoFSHypothesisStore:
         # Prepare data
         hypothesis_id = hypothesis_card.get("hypothesis_id", "unknown")
         content_hash = hypothesis_card.get("content_hash", "")
-        json_data = json.dumps(hypothesis_card, indent=2, ensure_ascii=False)
-
-        # Attributes for searchability
-        attributes = {
-            "HypothesisId": hypothesis_id,
-            "ContentHash": content_hash,
-            "Type": "HypothesisCard",
-            "Version": hypothesis_card.get("version", "v1"),
-            "CreatedAt": hypothesis_card.get("created_at", datetime.now(timezone.utc).isoformat()),
-            "FileName": f"{hypothesis_id}.json"
-        }
 
-        if not NEOFS_AVAILABLE or not self.upload_tool:
+        content, content_encoding = _encode_payload(hypothesis_card)
+
+        # Byte-identical payload already uploaded to this container (e.g. a
+        # mint retry). content_hash alone is not enough: the payload also
+        # carries neo_tx_id, created_at and author_wallet.
+        fingerprint = _payload_fingerprint(content)
+        uploaded = self._uploaded_objects.get(fingerprint)
+        if uploaded is not None and uploaded[:2] == (container_id, hypothesis_id):
+            object_id = uploaded[2]
+            self._uploaded_objects.move_to_end(fingerprint)
+            logger.info(f"[NeoFS] Hypothesis {hypothesis_id} already stored as {object_id}")
+            return {
+                "success": True,
+                "object_id": object_id,
+                "container_id": container_id,
+                "hypothesis_id": hypothesis_id,
+                "content_hash": content_hash,
+                "simulated": False,
+                "deduplicated": True
+            }
+
+        # Minted cards carry created_at; only read the clock when it is missing
+        created_at = hypothesis_card.get("created_at")
+        if created_at is None:
+            created_at = datetime.now(timezone.utc).isoformat()
+
+        # Attributes for searchability, patched onto a copy of the template
+        attributes = _OBJECT_ATTRIBUTES_TEMPLATE.copy()
+        attributes["HypothesisId"] = hypothesis_id
+        attributes["ContentHash"] = content_hash
+        attributes["Version"] = hypothesis_card.get("version", "v1")
+        attributes["CreatedAt"] = created_at
+        attributes["FileName"] = f"{hypothesis_id}.json"
+
+        if content_encoding:
+            attributes["ContentEncoding"] = content_encoding
+
+        if not _neofs_available() or not self.upload_tool:
             # Simulate upload
             object_id = f"simulated_obj_{hypothesis_id}"
-            print(f"[NeoFS Simulated] Stored hypothesis {hypothesis_id}")
-            print(f"  Container: {container_id}")
-            print(f"  Object ID: {object_id}")
+            logger.info(
+                f"[NeoFS Simulated] Stored hypothesis {hypothesis_id}\n"
+                f"  Container: {container_id}\n"
+                f"  Object ID: {object_id}"
+            )
             return {
                 "success": True,
                 "object_id": object_id,
@@ -204,27 +522,27 @@ class NeoFSHypothesisStore:
             bearer_token = os.getenv("NEOFS_BEARER_TOKEN", "")
             result = await self.upload_tool.execute(
                 container_id=container_id,
-                content=json_data,
+                content=content,
                 bearer_token=bearer_token if bearer_token else None,
                 attributes=attributes
             )
 
             # Result is a string (object ID or error message)
-            # Check for error indicators
-            is_error = (
-                not result or
-                not isinstance(result, str) or
-                result.startswith("Error") or
-                result.startswith("❌") or
-                "Failed" in result or
-                "Missing configuration" in result
-            )
+            is_error = _is_error_result(result)
 
             if not is_error:
                 object_id = result
-                print(f"[NeoFS] Stored hypothesis {hypothesis_id}")
-                print(f"  Container: {container_id}")
-                print(f"  Object ID: {object_id}")
+                self._missing_until.pop(hypothesis_id, None)
+                # Cache what was uploaded, not the caller's dict (the minting
+                # service keeps enriching it after the store)
+                self._cache_hypothesis(hypothesis_id, _loads_payload(content))
+                self._remember_upload(fingerprint, container_id, hypothesis_id, object_id)
+                self._remember_object_id(hypothesis_id, object_id)
+                logger.info(
+                    f"[NeoFS] Stored hypothesis {hypothesis_id}\n"
+                    f"  Container: {container_id}\n"
+                    f"  Object ID: {object_id}"
+                )
                 return {
                     "success": True,
                     "object_id": object_id,
@@ -236,7 +554,7 @@ class NeoFSHypothesisStore:
             else:
                 raise Exception(f"Upload failed: {result}")
         except Exception as e:
-            print(f"[Warning] NeoFS upload failed: {e}")
+            logger.warning(f"[Warning] NeoFS upload failed: {e}")
             # Fallback to simulated
             object_id = f"fallback_obj_{hypothesis_id}"
             return {
@@ -249,71 +567,257 @@ class NeoFSHypothesisStore:
                 "error": str(e)
             }
 
+    async def store_hypotheses_batch(self, hypothesis_cards: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Store several hypothesis cards on NeoFS concurrently.
+
+        The container is resolved once up front, then uploads are pipelined
+        (at most NEOFS_UPLOAD_CONCURRENCY in flight) instead of awaited one
+        after another. Each card stays a separate object so it remains
+        searchable by its HypothesisId attribute.
+
+        Args:
+            hypothesis_cards: The hypothesis cards to store
+
+        Returns:
+            list: One storage result per card, in input order
+        """
+        if not hypothesis_cards:
+            return []
+
+        await self.ensure_container()
+
+        semaphore = asyncio.Semaphore(NEOFS_UPLOAD_CONCURRENCY)
+
+        async def _store(card: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.store_hypothesis(card)
+
+        return list(await asyncio.gather(*(_store(card) for card in hypothesis_cards)))
+
     async def retrieve_hypothesis(self, hypothesis_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve a hypothesis card from NeoFS by hypothesis ID.
 
+        Cards are cached in memory after a successful store or download, so
+        repeat lookups skip the search and download round-trips. Use
+        invalidate() if an object is replaced outside this store.
+
         Args:
             hypothesis_id: The hypothesis ID to search for
 
         Returns:
-            dict: The hypothesis card, or None if not found
+            dict: The hypothesis card (shared with the cache; treat as
+                read-only), or None if not found
+        """
+        cached = self._cached_hypothesis(hypothesis_id)
+        if cached is not None:
+            return cached
+
+        if self._recently_missing(hypothesis_id):
+            return None
+
+        lock = self._retrieve_locks.setdefault(hypothesis_id, asyncio.Lock())
+        async with lock:
+            try:
+                # Another caller may have fetched it while we waited
+                cached = self._cached_hypothesis(hypothesis_id)
+                if cached is not None:
+                    return cached
+
+                card = await self._fetch_hypothesis(hypothesis_id)
+                if card is not None:
+                    self._cache_hypothesis(hypothesis_id, card)
+                return card
+            finally:
+                self._retrieve_locks.pop(hypothesis_id, None)
+
+    def invalidate(self, hypothesis_id: Optional[str] = None) -> None:
+        """
+        Drop cached hypothesis cards.
+
+        Args:
+            hypothesis_id: ID to drop; drops every cached card if None
+        """
+        if hypothesis_id is None:
+            self._retrieve_cache.clear()
+            self._missing_until.clear()
+            self._known_object_ids.clear()
+        else:
+            self._retrieve_cache.pop(hypothesis_id, None)
+            self._missing_until.pop(hypothesis_id, None)
+            self._known_object_ids.pop(hypothesis_id, None)
+
+    def _cached_hypothesis(self, hypothesis_id: str) -> Optional[Dict[str, Any]]:
+        """Return a cached card and mark it most recently used."""
+        card = self._retrieve_cache.get(hypothesis_id)
+        if card is not None:
+            self._retrieve_cache.move_to_end(hypothesis_id)
+        return card
+
+    def _cache_hypothesis(self, hypothesis_id: str, card: Dict[str, Any]) -> None:
+        """Add a card to the retrieve cache, evicting the least recently used."""
+        self._retrieve_cache[hypothesis_id] = card
+        self._retrieve_cache.move_to_end(hypothesis_id)
+        if len(self._retrieve_cache) > NEOFS_RETRIEVE_CACHE_MAX:
+            self._retrieve_cache.popitem(last=False)
+
+    def _remember_upload(
+        self,
+        fingerprint: str,
+        container_id: str,
+        hypothesis_id: str,
+        object_id: str
+    ) -> None:
+        """Record a completed upload, evicting the least recently used."""
+        self._uploaded_objects[fingerprint] = (container_id, hypothesis_id, object_id)
+        self._uploaded_objects.move_to_end(fingerprint)
+        if len(self._uploaded_objects) > NEOFS_RETRIEVE_CACHE_MAX:
+            self._uploaded_objects.popitem(last=False)
+
+    def _recently_missing(self, hypothesis_id: str) -> bool:
+        """Whether a search confirmed this ID absent within the TTL."""
+        expiry = self._missing_until.get(hypothesis_id)
+        if expiry is None:
+            return False
+        if expiry <= time.monotonic():
+            del self._missing_until[hypothesis_id]
+            return False
+        return True
+
+    def _remember_missing(self, hypothesis_id: str) -> None:
+        """Record a confirmed "not found", evicting the oldest entries."""
+        self._missing_until[hypothesis_id] = time.monotonic() + NEOFS_MISSING_TTL_SECONDS
+        self._missing_until.move_to_end(hypothesis_id)
+        if len(self._missing_until) > NEOFS_MISSING_CACHE_MAX:
+            self._missing_until.popitem(last=False)
+
+    async def _fetch_hypothesis(self, hypothesis_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Search for and download a hypothesis card from NeoFS.
+
+        If the ID previously resolved to a known object, that object is
+        downloaded speculatively while the search runs; a matching card
+        returns without waiting for the search. A failed or mismatched guess
+        counts as a miss and the search result is downloaded fresh.
         """
         if not self.container_id:
-            print("[Warning] No container ID set. Cannot retrieve.")
+            logger.warning("[Warning] No container ID set. Cannot retrieve.")
             return None
 
-        if not NEOFS_AVAILABLE or not self.search_tool or not self.download_tool:
-            print(f"[NeoFS Simulated] Retrieve not available for {hypothesis_id}")
+        if not _neofs_available() or not self.search_tool or not self.download_tool:
+            logger.info(f"[NeoFS Simulated] Retrieve not available for {hypothesis_id}")
             return None
 
-        try:
-            # Search for object by HypothesisId attribute
-            search_result = await self.search_tool.execute(
-                container_id=self.container_id,
-                filters={"HypothesisId": hypothesis_id}
-            )
+        likely_object_id = self._known_object_ids.get(hypothesis_id)
+        search_task = asyncio.create_task(self._search_object_id(hypothesis_id))
+        speculative_task = None
 
-            if not search_result.success or not search_result.output.get("objects"):
-                print(f"[NeoFS] Hypothesis {hypothesis_id} not found")
+        try:
+            if likely_object_id:
+                speculative_task = asyncio.create_task(self._download_guess(likely_object_id))
+                done, _ = await asyncio.wait(
+                    {search_task, speculative_task},
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if speculative_task in done:
+                    card = speculative_task.result()
+                    if card is not None and card.get("hypothesis_id") == hypothesis_id:
+                        return card
+
+            object_id = await search_task
+            if object_id is None:
+                self._known_object_ids.pop(hypothesis_id, None)
                 return None
 
-            # Get the first matching object
-            object_id = search_result.output["objects"][0]["object_id"]
+            card = None
+            if object_id == likely_object_id:
+                # The speculative download already fetched (or is fetching) it
+                card = await speculative_task
+                if card is not None and card.get("hypothesis_id") != hypothesis_id:
+                    card = None
+            if card is None:
+                card = await self._download_card(object_id)
+
+            if card is not None:
+                self._remember_object_id(hypothesis_id, object_id)
+            return card
+        except Exception as e:
+            logger.warning(f"[Warning] NeoFS retrieval failed: {e}")
+            return None
+        finally:
+            for task in (search_task, speculative_task):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    async def _search_object_id(self, hypothesis_id: str) -> Optional[str]:
+        """Find the object ID stored under a HypothesisId attribute."""
+        search_result = await self.search_tool.execute(
+            container_id=self.container_id,
+            filters={"HypothesisId": hypothesis_id}
+        )
 
-            # Download the object
-            download_result = await self.download_tool.execute(
-                container_id=self.container_id,
-                object_id=object_id
-            )
+        if not search_result.success:
+            logger.warning(f"[Warning] Search failed for {hypothesis_id}: {search_result.error}")
+            return None
 
-            if download_result.success:
-                content = download_result.output.get("content", "")
-                return json.loads(content)
-            else:
-                print(f"[Warning] Download failed: {download_result.error}")
-                return None
+        if not search_result.output.get("objects"):
+            self._remember_missing(hypothesis_id)
+            logger.info(f"[NeoFS] Hypothesis {hypothesis_id} not found")
+            return None
+
+        # Get the first matching object
+        return search_result.output["objects"][0]["object_id"]
+
+    async def _download_card(self, object_id: str) -> Optional[Dict[str, Any]]:
+        """Download and parse a card object."""
+        download_result = await self.download_tool.execute(
+            container_id=self.container_id,
+            object_id=object_id
+        )
+
+        if download_result.success:
+            content = download_result.output.get("content", "")
+            return _loads_payload(content)
+        logger.warning(f"[Warning] Download failed: {download_result.error}")
+        return None
+
+    async def _download_guess(self, object_id: str) -> Optional[Dict[str, Any]]:
+        """Speculatively download a card; any failure is a miss (None), never an error."""
+        try:
+            return await self._download_card(object_id)
         except Exception as e:
-            print(f"[Warning] NeoFS retrieval failed: {e}")
+            logger.info(f"[NeoFS] Speculative download of {object_id} missed: {e}")
             return None
 
+    def _remember_object_id(self, hypothesis_id: str, object_id: str) -> None:
+        """Record the object a hypothesis ID resolved to, evicting the oldest."""
+        self._known_object_ids[hypothesis_id] = object_id
+        self._known_object_ids.move_to_end(hypothesis_id)
+        if len(self._known_object_ids) > NEOFS_RETRIEVE_CACHE_MAX:
+            self._known_object_ids.popitem(last=False)
+
     async def get_balance(self) -> Optional[str]:
         """
         Get NeoFS account balance.
 
+        The last balance fetched is also kept in self.balance.
+
         Returns:
             str: Balance string, or None if unavailable
         """
-        if not NEOFS_AVAILABLE or not self.balance_tool:
-            return "N/A (simulated)"
+        if not _neofs_available() or not self.balance_tool:
+            self.balance = "N/A (simulated)"
+            return self.balance
 
         try:
             result = await self.balance_tool.execute()
             if result.success:
-                return result.output.get("balance", "Unknown")
+                self.balance = result.output.get("balance", "Unknown")
+                return self.balance
             return None
         except Exception as e:
-            print(f"[Warning] Balance check failed: {e}")
+            logger.warning(f"[Warning] Balance check failed: {e}")
             return None
 
 
@@ -321,6 +825,27 @@ class NeoFSHypothesisStore:
 # X402 Payment Integration
 # ============================================================================
 
+# Maximum concurrent payment header requests in a batch
+X402_PAYMENT_CONCURRENCY = 8
+
+
+@functools.cache
+def _env_x402_config() -> Tuple[Optional[str], Optional[str], str, float]:
+    """
+    Read X402 settings from the environment once per process.
+
+    Returns:
+        (private_key, receiver_address, network, mint_fee). Call
+        _env_x402_config.cache_clear() after changing the environment.
+    """
+    return (
+        os.getenv("X402_PRIVATE_KEY"),  # 0x-prefixed
+        os.getenv("X402_RECEIVER_ADDRESS"),
+        os.getenv("X402_NETWORK", "base-sepolia"),  # testnet by default
+        float(os.getenv("X402_MINT_FEE", X402MintingPayment.DEFAULT_MINT_FEE))
+    )
+
+
 class X402MintingPayment:
     """
     X402 payment integration for hypothesis minting.
@@ -334,25 +859,32 @@ class X402MintingPayment:
     Reference: https://xspoonai.github.io/docs/examples/x402-react-agent/
     """
 
+    __slots__ = (
+        "private_key",
+        "receiver_address",
+        "network",
+        "mint_fee",
+        "payment_header_tool",
+        "paywalled_request_tool",
+        "x402_service"
+    )
+
     # Default minting fee (in USDC)
     DEFAULT_MINT_FEE = 0.001  # $0.001 per hypothesis mint
 
     def __init__(self):
         """Initialize X402 payment handler."""
-        self.private_key = os.getenv("X402_PRIVATE_KEY")  # 0x-prefixed
-        self.receiver_address = os.getenv("X402_RECEIVER_ADDRESS")
-        self.network = os.getenv("X402_NETWORK", "base-sepolia")  # testnet by default
-        self.mint_fee = float(os.getenv("X402_MINT_FEE", self.DEFAULT_MINT_FEE))
+        self.private_key, self.receiver_address, self.network, self.mint_fee = _env_x402_config()
 
-        if not X402_AVAILABLE:
-            print("[Warning] X402 tools not available. Payments will be simulated.")
+        if not _x402_available():
+            logger.warning("[Warning] X402 tools not available. Payments will be simulated.")
 
         # Initialize tools if available
         self.payment_header_tool = None
         self.paywalled_request_tool = None
         self.x402_service = None
 
-        if X402_AVAILABLE and self.is_configured():
+        if _x402_available() and self.is_configured():
             try:
                 # Import X402 service components
                 from spoon_ai.payments.x402_service import X402PaymentService, X402Settings
@@ -369,13 +901,16 @@ class X402MintingPayment:
                 self.x402_service = X402PaymentService(settings=settings)
 
                 # Initialize tools with the service
-                self.payment_header_tool = X402PaymentHeaderTool(service=self.x402_service)
-                self.paywalled_request_tool = X402PaywalledRequestTool(service=self.x402_service)
-                print("[X402] Payment tools initialized successfully")
-                print(f"  Network: {self.network}")
-                print(f"  Receiver: {self.receiver_address}")
+                tools = _load_x402_tools()
+                self.payment_header_tool = tools.X402PaymentHeaderTool(service=self.x402_service)
+                self.paywalled_request_tool = tools.X402PaywalledRequestTool(service=self.x402_service)
+                logger.info(
+                    "[X402] Payment tools initialized successfully\n"
+                    f"  Network: {self.network}\n"
+                    f"  Receiver: {self.receiver_address}"
+                )
             except Exception as e:
-                print(f"[Warning] Failed to initialize X402 tools: {e}")
+                logger.warning(f"[Warning] Failed to initialize X402 tools: {e}")
 
     def is_configured(self) -> bool:
         """Check if X402 is properly configured."""
@@ -399,7 +934,7 @@ class X402MintingPayment:
             dict: Payment result with transaction details
         """
         if not self.is_configured():
-            print("[X402] Not configured. Skipping payment.")
+            logger.info("[X402] Not configured. Skipping payment.")
             return {
                 "success": True,
                 "payment_required": False,
@@ -407,11 +942,13 @@ class X402MintingPayment:
                 "simulated": True
             }
 
-        if not X402_AVAILABLE or not self.payment_header_tool:
+        if not _x402_available() or not self.payment_header_tool:
             # Simulate payment
-            print(f"[X402 Simulated] Payment for hypothesis {hypothesis_id}")
-            print(f"  Amount: {self.mint_fee} USDC")
-            print(f"  Network: {self.network}")
+            logger.info(
+                f"[X402 Simulated] Payment for hypothesis {hypothesis_id}\n"
+                f"  Amount: {self.mint_fee} USDC\n"
+                f"  Network: {self.network}"
+            )
             return {
                 "success": True,
                 "payment_required": True,
@@ -441,8 +978,10 @@ class X402MintingPayment:
             )
 
             if result.success:
-                print(f"[X402] Payment header created for {hypothesis_id}")
-                print(f"  Amount: {self.mint_fee} USDC")
+                logger.info(
+                    f"[X402] Payment header created for {hypothesis_id}\n"
+                    f"  Amount: {self.mint_fee} USDC"
+                )
                 return {
                     "success": True,
                     "payment_required": True,
@@ -456,7 +995,7 @@ class X402MintingPayment:
             else:
                 raise Exception(f"Payment header creation failed: {result.error}")
         except Exception as e:
-            print(f"[Warning] X402 payment failed: {e}")
+            logger.warning(f"[Warning] X402 payment failed: {e}")
             # Fallback to simulated
             return {
                 "success": True,
@@ -468,6 +1007,31 @@ class X402MintingPayment:
                 "error": str(e)
             }
 
+    async def create_mint_payments_batch(
+        self,
+        items: List[Tuple[str, str, str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Create payments for several hypotheses concurrently.
+
+        The X402 header tool signs one resource per call, so the calls are
+        overlapped (at most X402_PAYMENT_CONCURRENCY in flight) rather than
+        combined into one.
+
+        Args:
+            items: List of (hypothesis_id, content_hash, author_wallet) tuples
+
+        Returns:
+            list: One payment result per item, in input order
+        """
+        semaphore = asyncio.Semaphore(X402_PAYMENT_CONCURRENCY)
+
+        async def _pay(hypothesis_id: str, content_hash: str, author_wallet: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.create_mint_payment(hypothesis_id, content_hash, author_wallet)
+
+        return list(await asyncio.gather(*(_pay(*item) for item in items)))
+
     async def verify_payment(self, tx_hash: str) -> Dict[str, Any]:
         """
         Verify a payment transaction.
@@ -478,7 +1042,7 @@ class X402MintingPayment:
         Returns:
             dict: Verification result
         """
-        if not X402_AVAILABLE:
+        if not _x402_available():
             return {
                 "verified": True,
                 "simulated": True,
@@ -506,7 +1070,7 @@ class X402MintingPayment:
             "network": self.network,
             "mint_fee_usdc": self.mint_fee,
             "receiver": self.receiver_address[:10] + "..." if self.receiver_address else None,
-            "x402_available": X402_AVAILABLE
+            "x402_available": _x402_available()
         }
 
 
@@ -528,6 +1092,8 @@ class SpoonToolManager:
         result = await manager.store_and_pay(hypothesis_card, author_wallet)
     """
 
+    __slots__ = ("neofs", "x402", "_initialized")
+
     def __init__(self):
         """Initialize tool manager."""
         self.neofs = NeoFSHypothesisStore()
@@ -539,31 +1105,51 @@ class SpoonToolManager:
         if self._initialized:
             return
 
-        # Ensure NeoFS container exists
-        await self.neofs.ensure_container()
+        # Ensure NeoFS container exists; prefetch the balance (reported by
+        # get_status) in the same round-trip window
+        await asyncio.gather(
+            self.neofs.ensure_container(),
+            self.neofs.get_balance()
+        )
 
         self._initialized = True
-        print("[SpoonToolManager] Initialized successfully")
-        print(f"  NeoFS available: {NEOFS_AVAILABLE}")
-        print(f"  X402 available: {X402_AVAILABLE}")
-        print(f"  NeoFS container: {self.neofs.container_id}")
-        print(f"  X402 configured: {self.x402.is_configured()}")
+        logger.info(
+            "[SpoonToolManager] Initialized successfully\n"
+            f"  NeoFS available: {_neofs_available()}\n"
+            f"  X402 available: {_x402_available()}\n"
+            f"  NeoFS container: {self.neofs.container_id}\n"
+            f"  X402 configured: {self.x402.is_configured()}"
+        )
 
     async def store_hypothesis(self, hypothesis_card: Dict[str, Any]) -> Dict[str, Any]:
         """
         Store hypothesis on NeoFS.
 
+        Does not call initialize(); the NeoFS store resolves its container
+        itself. store_and_pay and the module-level helpers initialize first.
+
         Args:
             hypothesis_card: The hypothesis card to store
 
         Returns:
             dict: Storage result
         """
-        if not self._initialized:
-            await self.initialize()
-
         return await self.neofs.store_hypothesis(hypothesis_card)
 
+    async def store_hypotheses_batch(self, hypothesis_cards: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Store several hypotheses on NeoFS concurrently.
+
+        Does not call initialize() (see store_hypothesis).
+
+        Args:
+            hypothesis_cards: The hypothesis cards to store
+
+        Returns:
+            list: One storage result per card, in input order
+        """
+        return await self.neofs.store_hypotheses_batch(hypothesis_cards)
+
     async def process_payment(
         self,
         hypothesis_id: str,
@@ -573,6 +1159,8 @@ class SpoonToolManager:
         """
         Process X402 payment for minting.
 
+        Does not call initialize(); X402 needs no async setup.
+
         Args:
             hypothesis_id: The hypothesis ID
             content_hash: The content hash
@@ -581,15 +1169,27 @@ class SpoonToolManager:
         Returns:
             dict: Payment result
         """
-        if not self._initialized:
-            await self.initialize()
-
         return await self.x402.create_mint_payment(
             hypothesis_id=hypothesis_id,
             content_hash=content_hash,
             author_wallet=author_wallet
         )
 
+    async def process_payments_batch(
+        self,
+        items: List[Tuple[str, str, str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Process X402 payments for several hypotheses concurrently.
+
+        Args:
+            items: List of (hypothesis_id, content_hash, author_wallet) tuples
+
+        Returns:
+            list: One payment result per item, in input order
+        """
+        return await self.x402.create_mint_payments_batch(items)
+
     async def store_and_pay(
         self,
         hypothesis_card: Dict[str, Any],
@@ -604,7 +1204,11 @@ class SpoonToolManager:
         Args:
             hypothesis_card: The hypothesis card to store
             author_wallet: The author's wallet address
-            require_payment: Whether to require payment before storage
+            require_payment: Whether to require payment before storage. If
+                True, the payment runs first and the card is only stored once
+                a real (non-simulated) payment succeeds. Otherwise an optional (configured) payment runs
+                concurrently with storage and a failed payment is reported
+                without affecting the upload.
 
         Returns:
             dict: Combined result with storage and payment info
@@ -615,17 +1219,53 @@ class SpoonToolManager:
         hypothesis_id = hypothesis_card.get("hypothesis_id", "unknown")
         content_hash = hypothesis_card.get("content_hash", "")
 
-        # Process payment if configured and required
         payment_result = None
-        if require_payment or self.x402.is_configured():
-            payment_result = await self.process_payment(
-                hypothesis_id=hypothesis_id,
-                content_hash=content_hash,
-                author_wallet=author_wallet
-            )
+        if require_payment:
+            # Payment gates storage, so it cannot overlap the upload
+            try:
+                payment_result = await self.process_payment(
+                    hypothesis_id=hypothesis_id,
+                    content_hash=content_hash,
+                    author_wallet=author_wallet
+                )
+            except Exception as e:
+                logger.warning(f"[Warning] X402 payment failed: {e}")
+                payment_result = {"success": False, "error": str(e)}
 
-        # Store on NeoFS
-        storage_result = await self.store_hypothesis(hypothesis_card)
+            # create_mint_payment falls back to a simulated "success" when the
+            # payment cannot be made, so only a real payment unlocks storage
+            if not payment_result.get("success") or payment_result.get("simulated", True):
+                return {
+                    "success": False,
+                    "hypothesis_id": hypothesis_id,
+                    "storage": None,
+                    "payment": payment_result,
+                    "neofs_object_id": None,
+                    "neofs_container_id": None,
+                    "x402_payment": None,
+                    "error": "Required payment failed; hypothesis not stored"
+                }
+            storage_result = await self.store_hypothesis(hypothesis_card)
+        elif self.x402.is_configured():
+            # An optional payment and NeoFS storage are independent
+            # round-trips, so run them concurrently
+            payment_result, storage_result = await asyncio.gather(
+                self.process_payment(
+                    hypothesis_id=hypothesis_id,
+                    content_hash=content_hash,
+                    author_wallet=author_wallet
+                ),
+                self.store_hypothesis(hypothesis_card),
+                return_exceptions=True
+            )
+            if isinstance(storage_result, BaseException):
+                raise storage_result
+            if isinstance(payment_result, BaseException):
+                # A failed payment must not discard the completed upload
+                logger.warning(f"[Warning] X402 payment failed: {payment_result}")
+                payment_result = {"success": False, "error": str(payment_result)}
+        else:
+            storage_result = await self.store_hypothesis(hypothesis_card)
 
         return {
             "success": storage_result.get("success", False),
@@ -647,8 +1287,9 @@ class SpoonToolManager:
         return {
             "initialized": self._initialized,
             "neofs": {
-                "available": NEOFS_AVAILABLE,
-                "container_id": self.neofs.container_id
+                "available": _neofs_available(),
+                "container_id": self.neofs.container_id,
+                "balance": self.neofs.balance
             },
             "x402": self.x402.get_payment_info()
         }
@@ -661,15 +1302,47 @@ class SpoonToolManager:
 # Global tool manager instance
 _tool_manager: Optional[SpoonToolManager] = None
 
+# Per-context override (e.g. one manager per server request); tool instances
+# are shared process-wide either way
+_context_tool_manager: ContextVar[Optional[SpoonToolManager]] = ContextVar(
+    "trace_tool_manager", default=None
+)
+
 
 def get_tool_manager() -> SpoonToolManager:
-    """Get or create the global tool manager instance."""
+    """Get the tool manager bound to the current context, or the global instance."""
+    manager = _context_tool_manager.get()
+    if manager is not None:
+        return manager
+
     global _tool_manager
     if _tool_manager is None:
         _tool_manager = SpoonToolManager()
     return _tool_manager
 
 
+@contextmanager
+def use_tool_manager(manager: SpoonToolManager) -> Iterator[SpoonToolManager]:
+    """
+    Bind a tool manager to the current context.
+
+    Inside the block (and in tasks created from it), get_tool_manager() and
+    the convenience functions use this manager instead of the global one,
+    so concurrent requests do not share container or cache state.
+
+    Args:
+        manager: The manager to bind
+
+    Yields:
+        SpoonToolManager: The bound manager
+    """
+    token = _context_tool_manager.set(manager)
+    try:
+        yield manager
+    finally:
+        _context_tool_manager.reset(token)
+
+
 async def store_hypothesis_on_neofs(hypothesis_card: Dict[str, Any]) -> Dict[str, Any]:
     """
     Convenience function to store a hypothesis on NeoFS.
@@ -716,6 +1389,8 @@ async def mint_with_payment(
 if __name__ == "__main__":
     import asyncio
 
+    start_log_listener()
+
     async def test_tools():
         print("=" * 60)
         print("Testing SpoonOS Tool Integrations")
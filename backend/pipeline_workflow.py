@@ -7,11 +7,21 @@ Phase 0 → Phase 1 → Phase 2 → Phase 3 → Phase 4
 The workflow wraps existing functions without changing them, and the knowledge graph
 stays as dict-based (not Spoon graph objects).
 """
+import os
 import json
 import asyncio
-from typing import TypedDict, Optional, Dict, Any
+import functools
+import traceback
+from typing import TypedDict, Optional, Dict, Any, List, Callable, Awaitable
 from datetime import datetime, timezone
 
+# Prefer orjson (C extension) for parsing extraction output; stdlib json fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Try to import StateGraph
 try:
     from spoon_ai.graph import StateGraph, START, END
@@ -24,11 +34,14 @@ except ImportError:
     END = "__end__"
 
 # Import pipeline functions
-from extraction.pdf_reader import read_pdfs_from_folder
+from extraction.pdf_reader import find_pdfs, read_pdf
 from extraction.spoon_tool import extract_paper_structure_async
-from phase2.synergy_agent import SynergyAgent
-from phase3.hypothesis_agent import HypothesisAgent
-from phase4.minting_service import mint_hypothesis
+from phase2.synergy_agent import get_synergy_agent
+from phase3.hypothesis_agent import get_hypothesis_agent
+from phase4.minting_service import mint_hypothesis_async
+
+# Set TRACE_DEBUG=1 to print full tracebacks for failed nodes
+TRACE_DEBUG = bool(os.getenv("TRACE_DEBUG"))
 
 
 # ============================================================================
@@ -46,8 +59,11 @@ class PipelineState(TypedDict, total=False):
     author_wallet: str
     use_neofs: bool
     use_x402: bool
+    registry_batch: List[Dict[str, Any]]  # optional: defer registry writes to the caller
     
     # Phase 0 outputs
+    paper_a_path: str
+    paper_b_path: str
     paper_a_text: str
     paper_b_text: str
     paper_a_title: Optional[str]
@@ -79,216 +95,226 @@ class PipelineState(TypedDict, total=False):
 # Node Handlers
 # ============================================================================
 
+def _record_error(state: PipelineState, phase: str, label: str, error: BaseException) -> None:
+    """Record a node failure in the state (the graph then routes to END)."""
+    error_msg = str(error) if error else "Unknown error"
+    state["error"] = error_msg
+    state["error_phase"] = phase
+    print(f"[Workflow] {label} ERROR: {error_msg}")
+    if TRACE_DEBUG:
+        traceback.print_exception(error)
+
+
+def node_errors(phase: str) -> Callable:
+    """
+    Decorator for node handlers: an exception is recorded as the node's
+    error and error_phase instead of propagating out of the graph.
+    
+    Args:
+        phase: Phase tag for error_phase, e.g. "phase2"
+    """
+    def decorator(node: Callable[[PipelineState], Awaitable[PipelineState]]):
+        @functools.wraps(node)
+        async def wrapper(state: PipelineState) -> PipelineState:
+            try:
+                return await node(state)
+            except Exception as e:
+                _record_error(state, phase, f"Phase {phase.removeprefix('phase')}", e)
+                return state
+        return wrapper
+    return decorator
+
+
+@node_errors("phase0")
 async def read_pdfs_node(state: PipelineState) -> PipelineState:
     """
-    Node 1: Read PDFs from folder (Phase 0).
+    Node 1: Locate the two PDFs in the input folder (Phase 0).
     
-    Wraps: read_pdfs_from_folder()
+    Wraps: find_pdfs(). The PDFs themselves are read in extract_papers_node,
+    so each paper's extraction can start as soon as its own PDF is parsed.
     """
-    if "error" in state and state.get("error"):
-        return state  # Skip if previous error
+    paper_a_path, paper_b_path = find_pdfs(state["input_folder"])
     
-    try:
-        paper_a_text, paper_b_text, paper_a_title, paper_b_title = \
-            await asyncio.to_thread(
-                read_pdfs_from_folder,
-                state["input_folder"]
-            )
-        
-        state["paper_a_text"] = paper_a_text
-        state["paper_b_text"] = paper_b_text
-        state["paper_a_title"] = paper_a_title
-        state["paper_b_title"] = paper_b_title
-        
-        print(f"[Workflow] Phase 0: Read PDFs")
-        print(f"   Paper A: {paper_a_title or '(no title)'} ({len(paper_a_text)} chars)")
-        print(f"   Paper B: {paper_b_title or '(no title)'} ({len(paper_b_text)} chars)")
+    state["paper_a_path"] = paper_a_path
+    state["paper_b_path"] = paper_b_path
+    
+    print(f"[Workflow] Phase 0: Found PDFs")
+    print(f"   Paper A: {paper_a_path}")
+    print(f"   Paper B: {paper_b_path}")
+    
+    return state
+
+
+def _parse_extraction(json_str: str) -> Dict[str, Any]:
+    """
+    Parse one paper's extraction output, raising on an extraction error.
+    
+    Args:
+        json_str: JSON string returned by extract_paper_structure_async()
         
-        return state
-    except Exception as e:
-        error_msg = str(e) if e else "Unknown error"
-        state["error"] = error_msg
-        state["error_phase"] = "phase0"
-        print(f"[Workflow] Phase 0 ERROR: {error_msg}")
-        import traceback
-        traceback.print_exc()
-        return state
+    Returns:
+        dict: Parsed paper structure
+    """
+    try:
+        paper_json = orjson.loads(json_str) if ORJSON_AVAILABLE else json.loads(json_str)
+    except ValueError:
+        # orjson is stricter (e.g. rejects NaN); stdlib decides validity
+        paper_json = json.loads(json_str)
+    
+    if "error" in paper_json:
+        raise ValueError(f"Extraction error: {paper_json['error']}")
+    
+    return paper_json
 
 
-async def extract_paper_a_node(state: PipelineState) -> PipelineState:
+async def _read_and_extract_paper(pdf_path: str) -> Dict[str, Any]:
     """
-    Node 2a: Extract Paper A structure (Phase 1, parallel).
+    Read one PDF (Phase 0) and extract its structure (Phase 1).
     
-    Wraps: extract_paper_structure_async()
+    Returns:
+        dict: text, title and json on success; on failure, error (the
+              exception) and error_phase, plus whatever was read before it
     """
-    if "error" in state and state.get("error"):
-        return state  # Skip if previous error
+    try:
+        text, title = await asyncio.to_thread(read_pdf, pdf_path)
+    except Exception as e:
+        return {"error": e, "error_phase": "phase0"}
     
     try:
-        json_str = await extract_paper_structure_async(
-            paper_text=state["paper_a_text"],
-            title=state.get("paper_a_title", "")
-        )
-        paper_a_json = json.loads(json_str)
-        
-        if "error" in paper_a_json:
-            raise ValueError(f"Extraction error: {paper_a_json['error']}")
-        
-        state["paper_a_json"] = paper_a_json
-        
-        print(f"[Workflow] Phase 1a: Extracted Paper A ({len(paper_a_json.get('claims', []))} claims)")
-        
-        return state
+        json_str = await extract_paper_structure_async(paper_text=text, title=title or "")
+        return {"text": text, "title": title, "json": _parse_extraction(json_str)}
     except Exception as e:
-        error_msg = str(e) if e else "Unknown error"
-        state["error"] = error_msg
-        state["error_phase"] = "phase1"
-        print(f"[Workflow] Phase 1a ERROR: {error_msg}")
-        import traceback
-        traceback.print_exc()
-        return state
+        return {"text": text, "title": title, "error": e, "error_phase": "phase1"}
 
 
-async def extract_paper_b_node(state: PipelineState) -> PipelineState:
+@node_errors("phase1")
+async def extract_papers_node(state: PipelineState) -> PipelineState:
     """
-    Node 2b: Extract Paper B structure (Phase 1, parallel).
+    Node 2: Read and extract Paper A and Paper B concurrently (Phases 0-1).
     
-    Wraps: extract_paper_structure_async()
+    Wraps: read_pdf() + extract_paper_structure_async() per paper,
+    both papers via asyncio.gather(). Each paper's extraction starts as soon
+    as its own PDF is parsed, so one paper's PDF parse overlaps the other's
+    LLM call and the step takes as long as the slower paper.
     """
-    if "error" in state and state.get("error"):
-        return state  # Skip if previous error
-    
-    try:
-        json_str = await extract_paper_structure_async(
-            paper_text=state["paper_b_text"],
-            title=state.get("paper_b_title", "")
-        )
-        paper_b_json = json.loads(json_str)
-        
-        if "error" in paper_b_json:
-            raise ValueError(f"Extraction error: {paper_b_json['error']}")
+    results = await asyncio.gather(
+        _read_and_extract_paper(state["paper_a_path"]),
+        _read_and_extract_paper(state["paper_b_path"])
+    )
+    
+    # Handle each paper separately so the first failure names its paper
+    for label, paper, result in zip(("a", "b"), ("A", "B"), results):
+        if "text" in result:
+            state[f"paper_{label}_text"] = result["text"]
+            state[f"paper_{label}_title"] = result["title"]
+            print(f"[Workflow] Phase 0{label}: Read Paper {paper}: {result['title'] or '(no title)'} ({len(result['text'])} chars)")
         
-        state["paper_b_json"] = paper_b_json
+        if "error" in result:
+            phase = result["error_phase"]
+            _record_error(state, phase, f"Phase {phase.removeprefix('phase')}{label}", result["error"])
+            return state
         
-        print(f"[Workflow] Phase 1b: Extracted Paper B ({len(paper_b_json.get('claims', []))} claims)")
+        paper_json = result["json"]
+        state[f"paper_{label}_json"] = paper_json
         
-        return state
-    except Exception as e:
-        error_msg = str(e) if e else "Unknown error"
-        state["error"] = error_msg
-        state["error_phase"] = "phase1"
-        print(f"[Workflow] Phase 1b ERROR: {error_msg}")
-        import traceback
-        traceback.print_exc()
-        return state
+        print(f"[Workflow] Phase 1{label}: Extracted Paper {paper} ({len(paper_json.get('claims', []))} claims)")
+    
+    return state
 
 
+@node_errors("phase2")
 async def analyze_synergy_node(state: PipelineState) -> PipelineState:
     """
     Node 3: Analyze synergies and conflicts (Phase 2).
     
     Wraps: SynergyAgent.analyze_async()
     """
-    if "error" in state and state.get("error"):
-        return state  # Skip if previous error
+    agent = get_synergy_agent()
+    synergy_json = await agent.analyze_async(
+        state["paper_a_json"],
+        state["paper_b_json"]
+    )
     
-    try:
-        agent = SynergyAgent()
-        synergy_json = await agent.analyze_async(
-            state["paper_a_json"],
-            state["paper_b_json"]
-        )
-        
-        state["synergy_json"] = synergy_json
-        
-        print(f"[Workflow] Phase 2: Analyzed synergies")
-        print(f"   Overlapping variables: {len(synergy_json.get('overlapping_variables', []))}")
-        print(f"   Potential synergies: {len(synergy_json.get('potential_synergies', []))}")
-        print(f"   Potential conflicts: {len(synergy_json.get('potential_conflicts', []))}")
-        
-        return state
-    except Exception as e:
-        error_msg = str(e) if e else "Unknown error"
-        state["error"] = error_msg
-        state["error_phase"] = "phase2"
-        print(f"[Workflow] Phase 2 ERROR: {error_msg}")
-        import traceback
-        traceback.print_exc()
-        return state
+    state["synergy_json"] = synergy_json
+    
+    print(f"[Workflow] Phase 2: Analyzed synergies")
+    print(f"   Overlapping variables: {len(synergy_json.get('overlapping_variables', []))}")
+    print(f"   Potential synergies: {len(synergy_json.get('potential_synergies', []))}")
+    print(f"   Potential conflicts: {len(synergy_json.get('potential_conflicts', []))}")
+    
+    return state
 
 
+@node_errors("phase3")
 async def generate_hypothesis_node(state: PipelineState) -> PipelineState:
     """
     Node 4: Generate hypothesis (Phase 3).
     
     Wraps: HypothesisAgent.generate_hypothesis_async()
     """
-    if "error" in state and state.get("error"):
-        return state  # Skip if previous error
+    agent = get_hypothesis_agent()
+    hypothesis_card = await agent.generate_hypothesis_async(
+        state["paper_a_json"],
+        state["paper_b_json"],
+        state["synergy_json"]
+    )
     
-    try:
-        agent = HypothesisAgent()
-        hypothesis_card = await agent.generate_hypothesis_async(
-            state["paper_a_json"],
-            state["paper_b_json"],
-            state["synergy_json"]
-        )
-        
-        state["hypothesis_card"] = hypothesis_card
-        
-        print(f"[Workflow] Phase 3: Generated hypothesis")
-        print(f"   Hypothesis ID: {hypothesis_card.get('hypothesis_id')}")
-        print(f"   Confidence: {hypothesis_card.get('confidence')}")
-        
-        return state
-    except Exception as e:
-        state["error"] = str(e)
-        state["error_phase"] = "phase3"
-        print(f"[Workflow] Phase 3 ERROR: {e}")
-        return state
+    state["hypothesis_card"] = hypothesis_card
+    
+    print(f"[Workflow] Phase 3: Generated hypothesis")
+    print(f"   Hypothesis ID: {hypothesis_card.get('hypothesis_id')}")
+    print(f"   Confidence: {hypothesis_card.get('confidence')}")
+    
+    return state
 
 
+@node_errors("phase4")
 async def mint_hypothesis_node(state: PipelineState) -> PipelineState:
     """
     Node 5: Mint hypothesis (Phase 4).
     
-    Wraps: mint_hypothesis()
-    """
-    if "error" in state and state.get("error"):
-        return state  # Skip if previous error
+    Wraps: mint_hypothesis_async()
     
-    try:
-        mint_result = await asyncio.to_thread(
-            mint_hypothesis,
-            card=state["hypothesis_card"],
-            author_wallet=state["author_wallet"],
-            use_neofs=state.get("use_neofs", True),
-            use_x402=state.get("use_x402", False)
-        )
-        
-        state["mint_result"] = mint_result
-        state["pipeline_completed_at"] = datetime.now(timezone.utc).isoformat()
-        
-        print(f"[Workflow] Phase 4: Minted hypothesis")
-        print(f"   Hypothesis ID: {mint_result.get('hypothesis_id')}")
-        print(f"   Content Hash: {mint_result.get('content_hash')}")
-        print(f"   Neo TX ID: {mint_result.get('neo_tx_id')}")
-        
-        return state
-    except Exception as e:
-        error_msg = str(e) if e else "Unknown error"
-        state["error"] = error_msg
-        state["error_phase"] = "phase4"
-        print(f"[Workflow] Phase 4 ERROR: {error_msg}")
-        import traceback
-        traceback.print_exc()
-        return state
+    If state["registry_batch"] is set, the registry write is appended to it
+    for the caller to flush with save_hypotheses_batch() across many runs.
+    """
+    mint_result = await mint_hypothesis_async(
+        card=state["hypothesis_card"],
+        author_wallet=state["author_wallet"],
+        use_neofs=state.get("use_neofs", True),
+        use_x402=state.get("use_x402", False),
+        registry_batch=state.get("registry_batch")
+    )
+    
+    state["mint_result"] = mint_result
+    state["pipeline_completed_at"] = datetime.now(timezone.utc).isoformat()
+    
+    print(f"[Workflow] Phase 4: Minted hypothesis")
+    print(f"   Hypothesis ID: {mint_result.get('hypothesis_id')}")
+    print(f"   Content Hash: {mint_result.get('content_hash')}")
+    print(f"   Neo TX ID: {mint_result.get('neo_tx_id')}")
+    
+    return state
 
 
 # ============================================================================
 # Workflow Graph Builder
 # ============================================================================
 
+def _add_edge_unless_error(workflow: Any, source: str, target: str) -> None:
+    """
+    Connect source → target, routing to END instead when source set an error.
+    
+    Nodes record failures in state["error"]; ending the graph here means no
+    later node runs (or needs its own skip-on-error guard).
+    """
+    workflow.add_conditional_edges(
+        source,
+        lambda state: "error" if state.get("error") else target,
+        {"error": END, target: target}
+    )
+
+
 def build_pipeline_workflow() -> Any:
     """
     Build the Trace pipeline workflow graph.
@@ -305,8 +331,7 @@ def build_pipeline_workflow() -> Any:
     
     # Add nodes
     workflow.add_node("read_pdfs", read_pdfs_node)
-    workflow.add_node("extract_paper_a", extract_paper_a_node)
-    workflow.add_node("extract_paper_b", extract_paper_b_node)
+    workflow.add_node("extract_papers", extract_papers_node)
     workflow.add_node("analyze_synergy", analyze_synergy_node)
     workflow.add_node("generate_hypothesis", generate_hypothesis_node)
     workflow.add_node("mint_hypothesis", mint_hypothesis_node)
@@ -314,19 +339,12 @@ def build_pipeline_workflow() -> Any:
     # Set entry point
     workflow.set_entry_point("read_pdfs")
     
-    # Add edges: sequential flow
-    # Phase 0 → Phase 1 (parallel - both extractions run simultaneously)
-    workflow.add_edge("read_pdfs", "extract_paper_a")
-    workflow.add_edge("read_pdfs", "extract_paper_b")
-    
-    # Add parallel group for Phase 1 (both extractions run simultaneously)
-    workflow.add_parallel_group("extract_papers_parallel", ["extract_paper_a", "extract_paper_b"])
-    
-    # After both extractions complete, continue to Phase 2
-    # Connect only one node - parallel group ensures both complete before continuing
-    workflow.add_edge("extract_paper_a", "analyze_synergy")
-    workflow.add_edge("analyze_synergy", "generate_hypothesis")
-    workflow.add_edge("generate_hypothesis", "mint_hypothesis")
+    # Add edges: sequential flow, ending the run at the first failed phase
+    # Phase 0 → Phase 1 (extract_papers runs both extractions concurrently)
+    _add_edge_unless_error(workflow, "read_pdfs", "extract_papers")
+    _add_edge_unless_error(workflow, "extract_papers", "analyze_synergy")
+    _add_edge_unless_error(workflow, "analyze_synergy", "generate_hypothesis")
+    _add_edge_unless_error(workflow, "generate_hypothesis", "mint_hypothesis")
     workflow.add_edge("mint_hypothesis", END)
     
     # Compile graph
@@ -336,7 +354,6 @@ def build_pipeline_workflow() -> Any:
         return compiled
     except Exception as e:
         print(f"[Error] Failed to compile workflow graph: {e}")
-        import traceback
         traceback.print_exc()
         return None
 
@@ -409,14 +426,13 @@ async def process_papers_with_workflow(
         print(f"[DEBUG] hypothesis_card type: {type(final_state.get('hypothesis_card'))}")
         print(f"[DEBUG] mint_result type: {type(final_state.get('mint_result'))}")
         
-        # Debug: Print state keys
-        if "error" in final_state:
-            error_val = final_state.get("error")
+        # Debug: Print error state (single lookup, reused for the check below)
+        error_val = final_state.get("error")
+        if error_val is not None:
             print(f"[DEBUG] Error in state: {error_val} (type: {type(error_val)})")
             print(f"[DEBUG] Error phase: {final_state.get('error_phase')}")
         
         # Check for errors (only if error value is truthy, not just if key exists)
-        error_val = final_state.get("error")
         if error_val:  # Only treat as error if value is truthy (not None, not empty string)
             error_phase = final_state.get("error_phase", "unknown")
             print(f"\n[ERROR] Pipeline failed at {error_phase}")
@@ -447,7 +463,6 @@ async def process_papers_with_workflow(
         
     except Exception as e:
         print(f"\n[ERROR] Workflow execution failed: {e}")
-        import traceback
         traceback.print_exc()
         return {
             "error": str(e),
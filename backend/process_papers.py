@@ -21,6 +21,8 @@ from extraction.spoon_tool import extract_paper_structure_async
 from phase2.synergy_agent import analyze_papers
 from phase3.hypothesis_agent import generate_hypothesis
 from phase4.minting_service import mint_hypothesis
+from phase4.registry_store import start_log_buffer, stop_log_buffer
+from phase4.spoon_tools import start_log_listener, stop_log_listener
 
 
 async def process_papers_from_folder(
@@ -125,8 +127,8 @@ async def process_papers_from_folder(
     # Step 3: Phase 2 - Analyze synergies
     print("\n[Step 3] Phase 2: Analyzing synergies and conflicts...")
     try:
-        from phase2.synergy_agent import SynergyAgent
-        agent = SynergyAgent()
+        from phase2.synergy_agent import get_synergy_agent
+        agent = get_synergy_agent()
         synergy_json = await agent.analyze_async(paper_a_json, paper_b_json)
         print(f"[OK] Found {len(synergy_json.get('overlapping_variables', []))} overlapping variables")
         print(f"[OK] Found {len(synergy_json.get('potential_synergies', []))} potential synergies")
@@ -138,8 +140,8 @@ async def process_papers_from_folder(
     # Step 4: Phase 3 - Generate hypothesis
     print("\n[Step 4] Phase 3: Generating hypothesis...")
     try:
-        from phase3.hypothesis_agent import HypothesisAgent
-        agent = HypothesisAgent()
+        from phase3.hypothesis_agent import get_hypothesis_agent
+        agent = get_hypothesis_agent()
         hypothesis_card = await agent.generate_hypothesis_async(paper_a_json, paper_b_json, synergy_json)
         print(f"[OK] Hypothesis generated: {hypothesis_card.get('hypothesis_id')}")
         print(f"   Confidence: {hypothesis_card.get('confidence')}")
@@ -212,13 +214,21 @@ def main():
     
     args = parser.parse_args()
     
-    # Run async function (will use workflow graph if available)
-    result = asyncio.run(process_papers_from_folder(
-        input_folder=args.input_folder,
-        author_wallet=args.author_wallet,
-        use_neofs=args.use_neofs,
-        use_x402=args.use_x402
-    ))
+    # Registry messages are buffered; SpoonOS tool messages are written by a
+    # listener thread
+    start_log_buffer()
+    start_log_listener()
+    try:
+        # Run async function (will use workflow graph if available)
+        result = asyncio.run(process_papers_from_folder(
+            input_folder=args.input_folder,
+            author_wallet=args.author_wallet,
+            use_neofs=args.use_neofs,
+            use_x402=args.use_x402
+        ))
+    finally:
+        stop_log_listener()
+        stop_log_buffer()
     
     # Print summary
     if "error" in result:
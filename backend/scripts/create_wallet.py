@@ -8,112 +8,238 @@ IMPORTANT:
 - Never share your private key
 - This wallet is for TESTNET use only
 """
+import functools
+import importlib.util
+import os
+import select
 import sys
+import textwrap
+from pathlib import Path
 
-try:
-    from neo3.wallet.account import Account
-    NEO_AVAILABLE = True
-except ImportError:
-    NEO_AVAILABLE = False
-    print("=" * 60)
-    print("ERROR: neo-mamba SDK not installed")
-    print("=" * 60)
-    print("\nPlease install it first:")
-    print("  pip install neo-mamba")
-    print()
-    sys.exit(1)
+# Only probe for neo-mamba here; the SDK itself is imported inside
+# create_wallet() so check_existing_config() can exit without loading it.
+NEO_AVAILABLE = importlib.util.find_spec("neo3") is not None
 
+ENV_PATH = Path(__file__).parent.parent / "extraction" / ".env"
 
-def create_wallet():
-    """Create a new Neo N3 wallet and display credentials."""
-    print("=" * 60)
-    print("Neo N3 Wallet Generator")
-    print("=" * 60)
+# When piped or redirected, stdout carries only bare KEY=VALUE lines (all other
+# messages go to stderr) so it can be consumed directly, e.g.
+# eval "$(python create_wallet.py)"
+STDOUT_IS_TTY = sys.stdout.isatty()
 
-    # Generate new account
-    account = Account.create_new()
+# Compressed-key WIF for Neo N3: 52 base58 characters starting with K or L
+WIF_LENGTH = 52
+WIF_PREFIXES = ("K", "L")
 
-    print("\n✅ NEW WALLET CREATED SUCCESSFULLY!\n")
-    print("-" * 60)
-    print("SAVE THESE CREDENTIALS SECURELY:")
-    print("-" * 60)
+# Seconds to wait for an answer before falling back to the default
+PROMPT_TIMEOUT = 10.0
 
-    # Get WIF from private key
-    wif = Account.private_key_to_wif(account.private_key)
+# Horizontal rule used by the short status banners
+_HR = "=" * 60
 
-    print(f"\n📍 Address (public):     {account.address}")
-    print(f"🔑 Private Key (WIF):    {wif}")
-    print(f"📋 Script Hash:          {account.script_hash}")
 
-    print("\n" + "-" * 60)
-    print("NEXT STEPS:")
-    print("-" * 60)
-    print("""
-1. COPY your WIF private key above (starts with 'K' or 'L')
+# Everything create_wallet() prints on a terminal, written with a single stdout call
+_WALLET_REPORT = textwrap.dedent("""\
+    ============================================================
+    Neo N3 Wallet Generator
+    ============================================================
 
-2. GET TESTNET GAS:
-   Go to: https://n3t5wish.ngd.network/#/
-   Paste your ADDRESS (starts with 'N') to receive free testnet GAS
+    ✅ NEW WALLET CREATED SUCCESSFULLY!
 
-3. ADD TO YOUR .env FILE:
-   Edit: Trace/extraction/.env
-   Add these lines:
-""")
+    ------------------------------------------------------------
+    SAVE THESE CREDENTIALS SECURELY:
+    ------------------------------------------------------------
 
-    print(f"   NEO_NETWORK=testnet")
-    print(f"   NEO_PRIVATE_KEY={wif}")
+    📍 Address (public):     {address}
+    🔑 Private Key (WIF):    {wif}
+    📋 Script Hash:          {script_hash}
 
-    print("""
-4. VERIFY ON EXPLORER:
-   After getting GAS, check your balance at:
-   https://dora.coz.io/
-   Search for your address to see your balance
+    ------------------------------------------------------------
+    NEXT STEPS:
+    ------------------------------------------------------------
 
-5. RUN THE PIPELINE:
-   python process_papers.py
+    1. COPY your WIF private key above (starts with 'K' or 'L')
 
-   Your hypothesis will now be minted to the REAL Neo N3 testnet!
-""")
+    2. GET TESTNET GAS:
+       Go to: https://n3t5wish.ngd.network/#/
+       Paste your ADDRESS (starts with 'N') to receive free testnet GAS
+
+    3. ADD TO YOUR .env FILE:
+       Edit: Trace/extraction/.env
+       Add these lines:
+
+       NEO_NETWORK=testnet
+       NEO_PRIVATE_KEY={wif}
+
+    4. VERIFY ON EXPLORER:
+       After getting GAS, check your balance at:
+       https://dora.coz.io/
+       Search for your address to see your balance
+
+    5. RUN THE PIPELINE:
+       python process_papers.py
+
+       Your hypothesis will now be minted to the REAL Neo N3 testnet!
+
+    ============================================================
+    ⚠️  SECURITY WARNING
+    ============================================================
+
+    - NEVER share your private key (WIF)
+    - NEVER commit your .env file to git
+    - This is a TESTNET wallet - don't use for real funds
+    - Keep a backup of your WIF in a secure location
 
-    print("=" * 60)
-    print("⚠️  SECURITY WARNING")
-    print("=" * 60)
-    print("""
-- NEVER share your private key (WIF)
-- NEVER commit your .env file to git
-- This is a TESTNET wallet - don't use for real funds
-- Keep a backup of your WIF in a secure location
 """)
 
-    return account
 
+def _message_stream():
+    """Stream for human-facing messages: stdout on a terminal, else stderr."""
+    return sys.stdout if STDOUT_IS_TTY else sys.stderr
 
-def check_existing_config():
-    """Check if there's already a private key configured."""
-    import os
-    from pathlib import Path
-    from dotenv import load_dotenv
 
-    env_path = Path(__file__).parent.parent / "extraction" / ".env"
-    load_dotenv(env_path)
+def _say(text: str = "") -> None:
+    """Print a human-facing message, keeping piped stdout to KEY=VALUE lines."""
+    print(text, file=_message_stream())
 
-    existing_key = os.getenv("NEO_PRIVATE_KEY", "")
+
+def _require_neo():
+    """Exit with install instructions if neo-mamba is not installed."""
+    if not NEO_AVAILABLE:
+        _say(_HR)
+        _say("ERROR: neo-mamba SDK not installed")
+        _say(_HR)
+        _say("\nPlease install it first:")
+        _say("  pip install neo-mamba")
+        _say()
+        sys.exit(1)
+
+
+def create_wallet():
+    """
+    Create a new Neo N3 wallet and display credentials.
+    
+    Returns:
+        The new wallet's private key in WIF format. The Account object
+        (and its raw key) is dropped once the report has been written.
+    """
+    _require_neo()
+    from neo3.wallet.account import Account
+
+    # Generate new account
+    account = Account.create_new()
+
+    # Get WIF from private key
+    wif = Account.private_key_to_wif(account.private_key)
+
+    if STDOUT_IS_TTY:
+        sys.stdout.write(_WALLET_REPORT.format(
+            address=account.address,
+            wif=wif,
+            script_hash=account.script_hash,
+        ))
+    else:
+        sys.stdout.write(f"NEO_PRIVATE_KEY={wif}\nNEO_ADDRESS={account.address}\n")
+
+    del account
+    return wif
+
+
+@functools.lru_cache(maxsize=1)
+def _read_env(path: str) -> dict:
+    """
+    Read KEY=VALUE pairs from a .env file in a single pass.
+    
+    Args:
+        path: Path to the .env file
+        
+    Returns:
+        Dictionary of variables (empty if the file does not exist)
+    """
+    values = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return values
+    
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        if line.startswith("export "):
+            line = line[len("export "):]
+        key, value = line.split("=", 1)
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        elif " #" in value:
+            value = value.split(" #", 1)[0].rstrip()
+        values[key.strip()] = value
+    return values
+
+
+def _prompt_with_timeout(message: str, default: str = "n", timeout: float = PROMPT_TIMEOUT) -> str:
+    """
+    Ask a question on stdin, returning the default if no answer arrives in time.
+    
+    Args:
+        message: Prompt text
+        default: Answer used on timeout or end of input
+        timeout: Seconds to wait for an answer
+        
+    Returns:
+        The stripped, lowercased answer
+    """
+    stream = _message_stream()
+    stream.write(message)
+    stream.flush()
+    try:
+        ready, _, _ = select.select([sys.stdin], [], [], timeout)
+    except (OSError, ValueError):
+        # select() can't poll console handles on Windows; block as before
+        try:
+            return input().strip().lower() or default
+        except EOFError:
+            return default
+    
+    if not ready:
+        _say(f"\n[Wallet] No answer after {timeout:.0f}s, using default '{default}'")
+        return default
+    return sys.stdin.readline().strip().lower() or default
+
+
+def check_existing_config():
+    """Check if there's already a private key configured."""
+    # A key already exported in the environment wins (as with load_dotenv),
+    # so the .env file is only read when the variable is unset
+    existing_key = os.environ.get("NEO_PRIVATE_KEY", "")
+    config_source = "the NEO_PRIVATE_KEY environment variable"
+    if not existing_key:
+        existing_key = _read_env(str(ENV_PATH)).get("NEO_PRIVATE_KEY", "")
+        config_source = str(ENV_PATH)
+
+    # Placeholders such as "your_wif_private_key_here" are not a real key;
+    # don't ask about replacing them
+    if existing_key and not (len(existing_key) == WIF_LENGTH and existing_key.startswith(WIF_PREFIXES)):
+        _say(f"[Wallet] Ignoring existing key from {config_source}: not a valid WIF")
+        existing_key = ""
 
     if existing_key:
-        print("=" * 60)
-        print("EXISTING CONFIGURATION FOUND")
-        print("=" * 60)
-        print(f"\nYou already have a private key configured in:")
-        print(f"  {env_path}")
-        print("\nDo you want to create a NEW wallet anyway?")
-        print("(This will NOT overwrite your existing config)")
-
-        response = input("\nCreate new wallet? [y/N]: ").strip().lower()
+        _say(_HR)
+        _say("EXISTING CONFIGURATION FOUND")
+        _say(_HR)
+        _say(f"\nYou already have a private key configured in:")
+        _say(f"  {config_source}")
+        _say("\nDo you want to create a NEW wallet anyway?")
+        _say("(This will NOT overwrite your existing config)")
+
+        response = _prompt_with_timeout("\nCreate new wallet? [y/N]: ")
         if response != 'y':
-            print("\nExiting. Your existing configuration is unchanged.")
+            _say("\nExiting. Your existing configuration is unchanged.")
             sys.exit(0)
 
 
 if __name__ == "__main__":
     check_existing_config()
-    account = create_wallet()
+    create_wallet()